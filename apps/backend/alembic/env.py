@@ -11,7 +11,7 @@ from src.core.config import settings
 from src.db.base import Base
 
 # Import all models to ensure they are registered with Base
-from src.models import Conversation, Document, DocumentChunk, Message  # noqa: F401
+from src.models import Conversation, Document, DocumentChunk, EmbeddingCache, Message  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
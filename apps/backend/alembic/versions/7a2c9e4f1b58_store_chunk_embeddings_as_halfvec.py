@@ -0,0 +1,53 @@
+"""store chunk embeddings as halfvec
+
+Revision ID: 7a2c9e4f1b58
+Revises: f3b96d0c2e18
+Create Date: 2026-10-15 16:05:47.219384
+
+"""
+from alembic import op
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2c9e4f1b58'
+down_revision = 'f3b96d0c2e18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # fp16 chunk embeddings (pgvector >= 0.7 halfvec) halve table, index and
+    # per-probe bytes. The cosine opclass depends on the column type, so the
+    # index is dropped before the rewrite and rebuilt on the new type.
+    op.drop_index('idx_embedding_vector', table_name='document_chunks')
+    op.alter_column('document_chunks', 'embedding',
+               existing_type=pgvector.sqlalchemy.vector.VECTOR(dim=1536),
+               type_=pgvector.sqlalchemy.halfvec.HALFVEC(dim=1536),
+               existing_nullable=True,
+               postgresql_using='embedding::halfvec(1536)')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_embedding_vector', 'document_chunks', ['embedding'],
+            postgresql_using='ivfflat', postgresql_with={'lists': 100},
+            postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_embedding_vector', table_name='document_chunks')
+    op.alter_column('document_chunks', 'embedding',
+               existing_type=pgvector.sqlalchemy.halfvec.HALFVEC(dim=1536),
+               type_=pgvector.sqlalchemy.vector.VECTOR(dim=1536),
+               existing_nullable=True,
+               postgresql_using='embedding::vector(1536)')
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_embedding_vector', 'document_chunks', ['embedding'],
+            postgresql_using='ivfflat', postgresql_with={'lists': 100},
+            postgresql_ops={'embedding': 'vector_cosine_ops'},
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,91 @@
+"""add message_count to conversations
+
+Revision ID: 8ebd40b6f670
+Revises: d5e8f2a9b1c3
+Create Date: 2026-10-15 09:12:04.518230
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8ebd40b6f670'
+down_revision = 'd5e8f2a9b1c3'
+branch_labels = None
+depends_on = None
+
+# Number of rows backfilled per transaction
+BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # Add message_count with a server default (catalog-only change on PG11+)
+    op.add_column(
+        'conversations',
+        sa.Column('message_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+
+    # Keep the counter in sync on message insert/delete
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_conversation_message_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE conversations SET message_count = message_count + 1
+                WHERE id = NEW.conversation_id;
+                RETURN NEW;
+            ELSE
+                UPDATE conversations SET message_count = message_count - 1
+                WHERE id = OLD.conversation_id;
+                RETURN OLD;
+            END IF;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_message_count
+        AFTER INSERT OR DELETE ON messages
+        FOR EACH ROW EXECUTE FUNCTION update_conversation_message_count()
+    """)
+
+    # Backfill existing conversations in bounded row_number() ranges, after the
+    # trigger is live so messages inserted once a batch has run are counted by it.
+    conn = op.get_bind()
+    conn.execute(sa.text("""
+        CREATE TEMP TABLE _conv_batch AS
+        SELECT id, row_number() OVER (ORDER BY id) AS rn
+        FROM conversations
+    """))
+    conn.execute(sa.text("CREATE INDEX ON _conv_batch (rn)"))
+    total = conn.execute(sa.text("SELECT count(*) FROM _conv_batch")).scalar()
+
+    # Commit each batch separately so locks are released between batches. Under
+    # READ COMMITTED the recount's snapshot misses messages whose insert (and
+    # trigger increment) is still in flight, and overwriting the row would drop
+    # that increment. SHARE ROW EXCLUSIVE waits for in-flight message writes and
+    # blocks new ones until the batch commits, so none can interleave.
+    with op.get_context().autocommit_block():
+        for lo in range(1, total + 1, BATCH_SIZE):
+            conn.exec_driver_sql("BEGIN")
+            conn.exec_driver_sql("LOCK TABLE messages IN SHARE ROW EXCLUSIVE MODE")
+            conn.execute(
+                sa.text("""
+                    UPDATE conversations c
+                    SET message_count = (
+                        SELECT count(*) FROM messages m WHERE m.conversation_id = c.id
+                    )
+                    FROM _conv_batch b
+                    WHERE c.id = b.id
+                    AND b.rn BETWEEN :lo AND :hi
+                """),
+                {"lo": lo, "hi": lo + BATCH_SIZE - 1},
+            )
+            conn.exec_driver_sql("COMMIT")
+
+    conn.execute(sa.text("DROP TABLE _conv_batch"))
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_message_count ON messages")
+    op.execute("DROP FUNCTION IF EXISTS update_conversation_message_count()")
+    op.drop_column('conversations', 'message_count')
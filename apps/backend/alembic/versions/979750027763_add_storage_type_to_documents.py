@@ -4,6 +4,12 @@ Revision ID: 979750027763
 Revises: 9ff57d084d8a
 Create Date: 2025-12-09 10:36:29.141325
 
+The backfill was later rewritten into committed batches. Only databases that
+have not yet run this revision (fresh installs) take the batched path;
+databases already past it ran the original single UPDATE and need no follow-up
+revision, since nothing is left to backfill and the resulting column is the
+same.
+
 """
 from alembic import op
 import sqlalchemy as sa
@@ -15,22 +21,51 @@ down_revision = '9ff57d084d8a'
 branch_labels = None
 depends_on = None
 
+# Number of rows backfilled per transaction
+BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
-    # Add storage_type column as nullable first
-    op.add_column('documents', sa.Column('storage_type', sa.String(10), nullable=True))
-
-    # Migrate existing data: infer from file_path
-    op.execute("""
-        UPDATE documents
-        SET storage_type = CASE
-            WHEN file_path LIKE 's3://%' THEN 'cloud'
-            ELSE 'local'
-        END
-    """)
-
-    # Make non-nullable after data migration
-    op.alter_column('documents', 'storage_type', nullable=False)
+    # Add storage_type as NOT NULL with a 'local' server default. PostgreSQL 11+
+    # stores the default in the catalog without rewriting existing rows.
+    op.add_column(
+        'documents',
+        sa.Column('storage_type', sa.String(10), nullable=False, server_default='local'),
+    )
+
+    # Migrate existing data: only S3-backed rows need to change to 'cloud'
+    # Backfill in bounded row_number() ranges so each UPDATE only locks a small
+    # slice of rows instead of rewriting the whole table in one statement.
+    conn = op.get_bind()
+    conn.execute(sa.text("""
+        CREATE TEMP TABLE _doc_batch AS
+        SELECT id, row_number() OVER (ORDER BY id) AS rn
+        FROM documents
+        WHERE file_path LIKE 's3://%'
+    """))
+    conn.execute(sa.text("CREATE INDEX ON _doc_batch (rn)"))
+    total = conn.execute(sa.text("SELECT count(*) FROM _doc_batch")).scalar()
+
+    # Commit each batch separately so locks are released between batches
+    with op.get_context().autocommit_block():
+        for lo in range(1, total + 1, BATCH_SIZE):
+            conn.execute(
+                sa.text("""
+                    UPDATE documents d
+                    SET storage_type = 'cloud'
+                    FROM _doc_batch b
+                    WHERE d.id = b.id
+                    AND b.rn BETWEEN :lo AND :hi
+                """),
+                {"lo": lo, "hi": lo + BATCH_SIZE - 1},
+            )
+
+    conn.execute(sa.text("DROP TABLE _doc_batch"))
+
+    # The default was only needed for the backfill; the application always sets it.
+    # This leaves the same NOT NULL, default-less column that databases upgraded
+    # before this rewrite got from the original add-nullable/UPDATE/SET NOT NULL.
+    op.alter_column('documents', 'storage_type', server_default=None)
 
 
 def downgrade() -> None:
@@ -0,0 +1,32 @@
+"""add embedding cache
+
+Revision ID: a6d3f1b87e52
+Revises: e2a7d4c81f35
+Create Date: 2026-10-15 11:27:39.104853
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import pgvector.sqlalchemy
+
+
+# revision identifiers, used by Alembic.
+revision = 'a6d3f1b87e52'
+down_revision = 'e2a7d4c81f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('embedding_cache',
+    sa.Column('content_hash', sa.LargeBinary(length=32), nullable=False),
+    sa.Column('model_id', sa.String(length=255), nullable=False),
+    sa.Column('input_type', sa.String(length=50), nullable=False),
+    sa.Column('embedding', pgvector.sqlalchemy.vector.VECTOR(dim=1536), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('content_hash', 'model_id', 'input_type')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('embedding_cache')
@@ -0,0 +1,34 @@
+"""add conversation listing index
+
+Revision ID: b41e7c9a2d6f
+Revises: 8ebd40b6f670
+Create Date: 2026-10-15 10:03:47.221905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b41e7c9a2d6f'
+down_revision = '8ebd40b6f670'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves get_user_conversations (user_id, profile_id, ORDER BY updated_at DESC,
+    # id DESC with a (updated_at, id) keyset cursor) as a single index range scan. Built concurrently so writes are not blocked.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_conv_user_updated', 'conversations',
+            ['user_id', 'profile_id', sa.text('updated_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_conv_user_updated', table_name='conversations', postgresql_concurrently=True
+        )
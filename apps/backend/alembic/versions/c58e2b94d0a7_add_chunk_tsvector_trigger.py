@@ -0,0 +1,32 @@
+"""add chunk tsvector trigger
+
+Revision ID: c58e2b94d0a7
+Revises: a6d3f1b87e52
+Create Date: 2026-10-15 11:58:12.740316
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c58e2b94d0a7'
+down_revision = 'a6d3f1b87e52'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Compute content_tsvector as part of the INSERT/UPDATE that writes content,
+    # so each row is written once and the two can never diverge.
+    # 'simple' config: no stemming, works better for Chinese text.
+    # Existing rows already have their tsvector, so no backfill is needed.
+    op.execute("""
+        CREATE TRIGGER trg_chunk_tsvector
+        BEFORE INSERT OR UPDATE OF content ON document_chunks
+        FOR EACH ROW EXECUTE FUNCTION
+        tsvector_update_trigger(content_tsvector, 'pg_catalog.simple', content)
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_chunk_tsvector ON document_chunks")
@@ -59,13 +59,33 @@ def upgrade() -> None:
 
     # Add profile_id to conversations table
     op.add_column('conversations', sa.Column('profile_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_index('idx_conversation_profile_id', 'conversations', ['profile_id'], unique=False)
-    op.create_foreign_key('fk_conversation_profile', 'conversations', 'prompt_profiles', ['profile_id'], ['id'], ondelete='SET NULL')
+    op.execute(
+        "ALTER TABLE conversations ADD CONSTRAINT fk_conversation_profile "
+        "FOREIGN KEY (profile_id) REFERENCES prompt_profiles (id) ON DELETE SET NULL NOT VALID"
+    )
 
     # Add profile_id to documents table
     op.add_column('documents', sa.Column('profile_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_index('idx_document_profile_id', 'documents', ['profile_id'], unique=False)
-    op.create_foreign_key('fk_document_profile', 'documents', 'prompt_profiles', ['profile_id'], ['id'], ondelete='SET NULL')
+    op.execute(
+        "ALTER TABLE documents ADD CONSTRAINT fk_document_profile "
+        "FOREIGN KEY (profile_id) REFERENCES prompt_profiles (id) ON DELETE SET NULL NOT VALID"
+    )
+
+    # Build indexes on the pre-existing tables and validate the foreign keys outside
+    # the migration transaction (CREATE INDEX CONCURRENTLY cannot run inside one).
+    # Neither blocks writes: the NOT VALID constraints above are added without
+    # scanning existing rows, and VALIDATE only takes a SHARE UPDATE EXCLUSIVE lock.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_conversation_profile_id', 'conversations', ['profile_id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.create_index(
+            'idx_document_profile_id', 'documents', ['profile_id'],
+            unique=False, postgresql_concurrently=True,
+        )
+        op.execute("ALTER TABLE conversations VALIDATE CONSTRAINT fk_conversation_profile")
+        op.execute("ALTER TABLE documents VALIDATE CONSTRAINT fk_document_profile")
 
     # Data migration: Create default profiles for existing users and link existing data
     # This will be done via a separate data migration script or SQL
@@ -73,14 +93,21 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
+    # Drop indexes on the pre-existing tables without blocking writes
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_document_profile_id', table_name='documents', postgresql_concurrently=True
+        )
+        op.drop_index(
+            'idx_conversation_profile_id', table_name='conversations', postgresql_concurrently=True
+        )
+
     # Drop foreign keys and columns from documents
     op.drop_constraint('fk_document_profile', 'documents', type_='foreignkey')
-    op.drop_index('idx_document_profile_id', table_name='documents')
     op.drop_column('documents', 'profile_id')
 
     # Drop foreign keys and columns from conversations
     op.drop_constraint('fk_conversation_profile', 'conversations', type_='foreignkey')
-    op.drop_index('idx_conversation_profile_id', table_name='conversations')
     op.drop_column('conversations', 'profile_id')
 
     # Drop indexes on prompt_profiles
@@ -0,0 +1,34 @@
+"""add unique lower(email) index
+
+Revision ID: e2a7d4c81f35
+Revises: b41e7c9a2d6f
+Create Date: 2026-10-15 10:41:18.630472
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2a7d4c81f35'
+down_revision = 'b41e7c9a2d6f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Case-insensitive email uniqueness, enforced by register's
+    # INSERT ... ON CONFLICT DO NOTHING. Built concurrently so writes are not
+    # blocked; fails (leaving an INVALID index) if existing emails collide by case.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'users_email_lower_idx', 'users', [sa.text('lower(email)')],
+            unique=True, postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'users_email_lower_idx', table_name='users', postgresql_concurrently=True
+        )
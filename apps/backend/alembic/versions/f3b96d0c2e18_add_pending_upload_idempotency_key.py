@@ -0,0 +1,41 @@
+"""add pending upload idempotency key
+
+Revision ID: f3b96d0c2e18
+Revises: c58e2b94d0a7
+Create Date: 2026-10-15 14:22:05.318840
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b96d0c2e18'
+down_revision = 'c58e2b94d0a7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Client-generated idempotency key for presigned uploads. Existing rows stay
+    # NULL, which never conflicts, so no existing pending upload is affected.
+    op.add_column('documents', sa.Column('upload_key', postgresql.UUID(as_uuid=True), nullable=True))
+
+    # At most one pending presigned upload per key: retried presigned-URL requests
+    # upsert onto it (INSERT ... ON CONFLICT) instead of adding orphan rows.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uniq_pending_cloud_document', 'documents',
+            ['user_id', 'upload_key'],
+            unique=True, postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'pending' AND storage_type = 'cloud'"),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uniq_pending_cloud_document', table_name='documents', postgresql_concurrently=True
+        )
+    op.drop_column('documents', 'upload_key')
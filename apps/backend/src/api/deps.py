@@ -65,7 +65,8 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user = user_service.get_user_by_id(db, user_id)
+    # Resolve the default profile ID with the same query so routes don't re-query it
+    user, default_profile_id = user_service.get_user_with_default_profile_id(db, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -79,6 +80,7 @@ def get_current_user(
             detail="Inactive user",
         )
 
+    user.default_profile_id = default_profile_id
     return user
 
 
@@ -53,21 +53,7 @@ def register(request: RegisterRequest, db: DBSession) -> TokenResponse:
     Raises:
         HTTPException: If username or email already exists
     """
-    # Check if username already exists
-    if user_service.get_user_by_username(db, request.username):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Username already registered",
-        )
-
-    # Check if email already exists
-    if user_service.get_user_by_email(db, request.email):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered",
-        )
-
-    # Create user
+    # Create user; uniqueness is enforced atomically by the insert
     user = user_service.create_user(
         db=db,
         username=request.username,
@@ -76,6 +62,13 @@ def register(request: RegisterRequest, db: DBSession) -> TokenResponse:
         full_name=request.full_name,
     )
 
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=user_service.get_registration_conflict(db, request.username, request.email)
+            or "Username or email already registered",
+        )
+
     # Create access token
     access_token = create_access_token(data={"sub": str(user.id)})
 
@@ -2,17 +2,26 @@
 Chat routes for conversation management and messaging.
 """
 
+import logging
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
 
-from fastapi import APIRouter, Query
-from pydantic import BaseModel
+import orjson
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 
 from src.api.deps import CurrentUser, DBSession
-from src.models import MessageRole
+from src.core.config import settings
+from src.models import Conversation, Message, MessageRole, User
+from src.models.prompt_profile import PromptProfile
 from src.services import chat_service, profile_service
 
-router = APIRouter(prefix="/chat", tags=["chat"])
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/chat", tags=["chat"], default_response_class=ORJSONResponse)
 
 
 class ChatRequest(BaseModel):
@@ -26,7 +35,7 @@ class ChatRequest(BaseModel):
 class MessageResponse(BaseModel):
     """Message response model."""
 
-    id: str
+    id: uuid.UUID
     role: str
     content: str
     created_at: datetime
@@ -35,14 +44,14 @@ class MessageResponse(BaseModel):
 class ChatResponse(BaseModel):
     """Chat response model."""
 
-    conversation_id: str
+    conversation_id: uuid.UUID
     messages: list[MessageResponse]
 
 
 class ConversationListItem(BaseModel):
     """Conversation list item model."""
 
-    id: str
+    id: uuid.UUID
     title: str
     created_at: datetime
     updated_at: datetime
@@ -53,75 +62,149 @@ class ConversationListResponse(BaseModel):
     """Conversation list response model."""
 
     conversations: list[ConversationListItem]
+    has_more: bool = False
+    next_cursor: datetime | None = Field(
+        None, description="updated_at to pass as before to fetch the next page"
+    )
+    next_cursor_id: uuid.UUID | None = Field(
+        None, description="Conversation ID to pass as before_id to fetch the next page"
+    )
 
 
 class ConversationHistoryResponse(BaseModel):
     """Conversation history response model."""
 
-    conversation_id: str
+    conversation_id: uuid.UUID
     messages: list[MessageResponse]
 
 
-@router.post("/message", response_model=ChatResponse)
-def send_message(
+# ========== Helper Functions ==========
+
+
+def _start_chat_turn(
     request: ChatRequest,
-    db: DBSession,
-    current_user: CurrentUser,
-) -> ChatResponse:
+    db: Session,
+    current_user: User,
+) -> tuple[PromptProfile, Conversation, list[Message], Message]:
     """
-    Send a message and get response.
+    Resolve profile, conversation and history, and build the user message.
+
+    Nothing is committed here; the conversation, title and user message are
+    persisted together with the assistant message.
 
     Args:
         request: Chat request with message, optional conversation_id, and optional profile_id
         db: Database session
-        current_user: Current user ID
+        current_user: Current user
 
     Returns:
-        ChatResponse: Response with conversation ID and messages
+        tuple: (profile, conversation, history, unsaved user message)
+
+    Raises:
+        HTTPException: If the profile is not found
     """
-    # Get profile: use specified profile_id or default profile
+    # Use specified profile_id or the default profile resolved with the current user
     if request.profile_id:
-        profile = profile_service.get_profile_by_id(
-            db=db,
-            profile_id=uuid.UUID(request.profile_id),
-            user_id=current_user.id,
-        )
-        if not profile:
-            from fastapi import HTTPException, status
-
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Profile not found",
-            )
+        profile_id = uuid.UUID(request.profile_id)
     else:
-        profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
+        profile_id = profile_service.get_default_profile_id(current_user)
 
-    # Get or create conversation
-    conversation = chat_service.get_or_create_conversation(
+    # Load profile, conversation and history in one query
+    profile, conversation, history = chat_service.load_chat_context(
         db=db,
         user_id=current_user.id,
-        profile_id=profile.id,
+        profile_id=profile_id,
         conversation_id=request.conversation_id,
     )
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found",
+        )
 
-    # Get conversation history
-    history = chat_service.get_conversation_history(db=db, conversation_id=conversation.id)
+    # Create conversation if it doesn't exist yet (committed with the messages)
+    if not conversation:
+        conversation = chat_service.new_conversation(
+            db=db,
+            user_id=current_user.id,
+            profile_id=profile.id,
+        )
 
     # Generate title for new conversations (first message)
     if not history:  # No previous messages means this is the first message
-        title = chat_service.generate_conversation_title(request.message)
-        conversation.title = title
-        db.commit()
-        db.refresh(conversation)
+        conversation.title = chat_service.generate_conversation_title(request.message)
 
-    # Save user message
-    user_message = chat_service.save_message(
-        db=db,
+    user_message = chat_service.new_message(
         conversation_id=conversation.id,
         role=MessageRole.USER,
         content=request.message,
     )
 
+    return profile, conversation, history, user_message
+
+
+def _build_chat_response(conversation: Conversation, messages: list[Message]) -> ChatResponse:
+    """
+    Build chat response from a conversation and its new messages.
+
+    Args:
+        conversation: Conversation the messages belong to
+        messages: New user and assistant messages
+
+    Returns:
+        ChatResponse: Response with conversation ID and messages
+    """
+    # Trusted data from our own rows: skip validation with model_construct
+    return ChatResponse.model_construct(
+        conversation_id=conversation.id,
+        messages=[
+            MessageResponse.model_construct(
+                id=msg.id,
+                role=msg.role,
+                content=msg.content,
+                created_at=msg.created_at,
+            )
+            for msg in messages
+        ],
+    )
+
+
+def _sse_event(event: str, data: str) -> str:
+    """
+    Format a server-sent event.
+
+    Args:
+        event: Event name
+        data: Event payload (single-line JSON)
+
+    Returns:
+        str: Encoded SSE event
+    """
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+# ========== Routes ==========
+
+
+@router.post("/message", response_model=ChatResponse)
+def send_message(
+    request: ChatRequest,
+    db: DBSession,
+    current_user: CurrentUser,
+) -> ChatResponse:
+    """
+    Send a message and get response.
+
+    Args:
+        request: Chat request with message, optional conversation_id, and optional profile_id
+        db: Database session
+        current_user: Current user ID
+
+    Returns:
+        ChatResponse: Response with conversation ID and messages
+    """
+    profile, conversation, history, user_message = _start_chat_turn(request, db, current_user)
+
     # Generate response with profile settings
     assistant_content, retrieved_chunks = chat_service.generate_response(
         user_message=request.message,
@@ -131,39 +214,105 @@ def send_message(
         user_id=current_user.id,
     )
 
-    # Save assistant message with retrieved chunks
-    assistant_message = chat_service.save_message(
-        db=db,
+    assistant_message = chat_service.new_message(
         conversation_id=conversation.id,
         role=MessageRole.ASSISTANT,
         content=assistant_content,
         retrieved_chunks=retrieved_chunks,
     )
 
-    return ChatResponse(
-        conversation_id=str(conversation.id),
-        messages=[
-            MessageResponse(
-                id=str(user_message.id),
-                role=user_message.role,
-                content=user_message.content,
-                created_at=user_message.created_at,
-            ),
-            MessageResponse(
-                id=str(assistant_message.id),
-                role=assistant_message.role,
-                content=assistant_message.content,
-                created_at=assistant_message.created_at,
-            ),
-        ],
+    response = _build_chat_response(conversation, [user_message, assistant_message])
+
+    # Persist title update, user message and assistant message in one commit
+    chat_service.save_messages(db=db, messages=[user_message, assistant_message])
+
+    return response
+
+
+@router.post("/message/stream")
+def send_message_stream(
+    request: ChatRequest,
+    db: DBSession,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Send a message and stream the response as server-sent events.
+
+    Emits a "token" event (JSON string) per response text chunk, followed by a
+    "done" event carrying the same payload as /message once both messages are saved.
+    If the LLM fails, an "error" event with a user-friendly detail replaces "done";
+    the user message and any partial model output are still saved.
+
+    Args:
+        request: Chat request with message, optional conversation_id, and optional profile_id
+        db: Database session
+        current_user: Current user ID
+
+    Returns:
+        StreamingResponse: text/event-stream response
+    """
+    profile, conversation, history, user_message = _start_chat_turn(request, db, current_user)
+
+    # RAG retrieval happens here; the LLM runs while the stream is consumed
+    tokens, retrieved_chunks = chat_service.stream_response(
+        user_message=request.message,
+        conversation_history=history,
+        profile=profile,
+        db=db,
+        user_id=current_user.id,
     )
 
+    def event_stream() -> Iterator[str]:
+        parts: list[str] = []
+        error: Exception | None = None
+        messages = [user_message]
+        try:
+            try:
+                for token in tokens:
+                    parts.append(token)
+                    yield _sse_event("token", orjson.dumps(token).decode())
+            except Exception as e:
+                logger.error(f"Failed to stream response: {e}")
+                error = e
+        finally:
+            # Runs on client disconnect too, so the user message, a new conversation
+            # and its title are never lost; only real model output is saved
+            if parts:
+                messages.append(
+                    chat_service.new_message(
+                        conversation_id=conversation.id,
+                        role=MessageRole.ASSISTANT,
+                        content="".join(parts),
+                        retrieved_chunks=retrieved_chunks,
+                    )
+                )
+
+            # Re-attach the conversation in case the request session was closed
+            # before streaming started
+            db.add(conversation)
+            chat_service.save_messages(db=db, messages=messages)
+
+        if error is not None:
+            detail = chat_service.get_error_message(error)
+            yield _sse_event("error", orjson.dumps({"detail": detail}).decode())
+        else:
+            response = _build_chat_response(conversation, messages)
+            yield _sse_event("done", response.model_dump_json())
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 
 @router.get("/conversations", response_model=ConversationListResponse)
 def get_conversations(
     db: DBSession,
     current_user: CurrentUser,
     profile_id: str | None = Query(None, description="Filter by profile ID"),
+    before: datetime | None = Query(
+        None, description="Keyset cursor: updated_at of the last conversation on the previous page"
+    ),
+    before_id: uuid.UUID | None = Query(
+        None, description="Keyset cursor: id of the last conversation on the previous page"
+    ),
 ) -> ConversationListResponse:
     """
     Get all conversations for current user, optionally filtered by profile.
@@ -172,38 +321,62 @@ def get_conversations(
         db: Database session
         current_user: Current user ID
         profile_id: Optional profile ID to filter conversations
+        before: Keyset cursor from a previous page's next_cursor
+        before_id: Keyset cursor from a previous page's next_cursor_id
 
     Returns:
         ConversationListResponse: Response with list of conversations
+
+    Raises:
+        HTTPException: If only one of before and before_id is given
     """
+    if (before is None) != (before_id is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="before and before_id must be given together",
+        )
+
     # If profile_id not provided, use default profile
     if not profile_id:
-        default_profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
-        profile_uuid = default_profile.id
+        profile_uuid = profile_service.get_default_profile_id(current_user)
     else:
         profile_uuid = uuid.UUID(profile_id)
 
+    # Fetch one extra row to detect whether another page exists
+    limit = settings.USER_CONVERSATIONS_LIMIT
     conversations = chat_service.get_user_conversations(
-        db=db, user_id=current_user.id, profile_id=profile_uuid
+        db=db,
+        user_id=current_user.id,
+        profile_id=profile_uuid,
+        limit=limit + 1,
+        before=(before, before_id) if before is not None else None,
     )
 
+    has_more = len(conversations) > limit
+    conversations = conversations[:limit]
+
     conversation_items = [
-        ConversationListItem(
-            id=str(conv.id),
+        ConversationListItem.model_construct(
+            id=conv.id,
             title=conv.title or "Untitled Conversation",
             created_at=conv.created_at,
             updated_at=conv.updated_at,
-            message_count=msg_count,
+            message_count=conv.message_count,
         )
-        for conv, msg_count in conversations
+        for conv in conversations
     ]
 
-    return ConversationListResponse(conversations=conversation_items)
+    return ConversationListResponse.model_construct(
+        conversations=conversation_items,
+        has_more=has_more,
+        next_cursor=conversations[-1].updated_at if has_more else None,
+        next_cursor_id=conversations[-1].id if has_more else None,
+    )
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationHistoryResponse)
 def get_conversation_history(
-    conversation_id: str,
+    conversation_id: uuid.UUID,
     db: DBSession,
     _current_user: CurrentUser,
 ) -> ConversationHistoryResponse:
@@ -218,14 +391,13 @@ def get_conversation_history(
     Returns:
         ConversationHistoryResponse: Conversation history with messages
     """
-    conv_uuid = uuid.UUID(conversation_id)
-    messages = chat_service.get_conversation_history(db=db, conversation_id=conv_uuid)
+    messages = chat_service.get_conversation_history(db=db, conversation_id=conversation_id)
 
-    return ConversationHistoryResponse(
+    return ConversationHistoryResponse.model_construct(
         conversation_id=conversation_id,
         messages=[
-            MessageResponse(
-                id=str(msg.id),
+            MessageResponse.model_construct(
+                id=msg.id,
                 role=msg.role,
                 content=msg.content,
                 created_at=msg.created_at,
@@ -263,12 +435,12 @@ def create_conversation(
     }
 
 
-@router.delete("/conversations/{conversation_id}")
+@router.delete("/conversations/{conversation_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_conversation(
-    conversation_id: str,
+    conversation_id: uuid.UUID,
     db: DBSession,
     current_user: CurrentUser,
-) -> dict:
+) -> None:
     """
     Delete a conversation.
 
@@ -277,14 +449,17 @@ def delete_conversation(
         db: Database session
         current_user: Current user ID
 
-    Returns:
-        dict: Deletion status
+    Raises:
+        HTTPException: If conversation not found (HTTP 404)
     """
-    conv_uuid = uuid.UUID(conversation_id)
     success = chat_service.delete_conversation(
         db=db,
-        conversation_id=conv_uuid,
+        conversation_id=conversation_id,
         user_id=current_user.id,
     )
 
-    return {"success": success, "message": "Conversation deleted" if success else "Not found"}
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Conversation not found",
+        )
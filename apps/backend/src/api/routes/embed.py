@@ -6,11 +6,13 @@ This module provides endpoints for browsing embedded chunks.
 
 import logging
 import uuid
+from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.api.deps import CurrentUser, DBSession
@@ -18,7 +20,7 @@ from src.models.document import Document, DocumentChunk
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/embeds", tags=["embeds"])
+router = APIRouter(prefix="/embeds", tags=["embeds"], default_response_class=ORJSONResponse)
 
 
 # ========== Request/Response Models ==========
@@ -27,11 +29,11 @@ router = APIRouter(prefix="/embeds", tags=["embeds"])
 class ChunkListItem(BaseModel):
     """Chunk list item model."""
 
-    id: str
-    document_id: str
+    id: uuid.UUID
+    document_id: uuid.UUID
     chunk_index: int
     content: str
-    created_at: str
+    created_at: datetime
     metadata: dict[str, Any] = Field(default_factory=dict)
     embedding_dimension: int | None = None
 
@@ -40,21 +42,29 @@ class ChunkListResponse(BaseModel):
     """Chunk list response model."""
 
     chunks: list[ChunkListItem]
-    total: int
-    document_id: str
+    total: int = Field(
+        ..., description="Total number of chunks in the document, independent of the cursor"
+    )
+    document_id: uuid.UUID
     document_name: str
+    has_more: bool = False
+    next_cursor: int | None = Field(
+        None, description="chunk_index to pass as after_index to fetch the next page"
+    )
 
 
 # ========== Helper Functions ==========
 
 
-def get_document_with_ownership(db: Session, document_id: str, user_id: uuid.UUID) -> Document:
+def get_document_with_ownership(
+    db: Session, document_id: uuid.UUID, user_id: uuid.UUID
+) -> Document:
     """
     Get document and verify ownership.
 
     Args:
         db: Database session
-        document_id: Document UUID string
+        document_id: Document UUID
         user_id: User UUID
 
     Returns:
@@ -63,15 +73,7 @@ def get_document_with_ownership(db: Session, document_id: str, user_id: uuid.UUI
     Raises:
         HTTPException: If document not found or user doesn't own it
     """
-    try:
-        doc_uuid = uuid.UUID(document_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid document ID format",
-        )
-
-    stmt = select(Document).where(Document.id == doc_uuid, Document.user_id == user_id)
+    stmt = select(Document).where(Document.id == document_id, Document.user_id == user_id)
     result = db.execute(stmt)
     document = result.scalar_one_or_none()
 
@@ -89,66 +91,78 @@ def get_document_with_ownership(db: Session, document_id: str, user_id: uuid.UUI
 
 @router.get("/documents/{document_id}/chunks", response_model=ChunkListResponse)
 def list_chunks(
-    document_id: str,
+    document_id: uuid.UUID,
     current_user: CurrentUser = None,
     db: DBSession = None,
+    limit: int = Query(100, ge=1, le=500, description="Maximum number of chunks to return"),
+    after_index: int | None = Query(
+        None, description="Return chunks after this chunk_index (keyset cursor)"
+    ),
 ) -> ChunkListResponse:
     """
-    Get all chunks for a document.
+    Get a page of chunks for a document, ordered by chunk_index.
 
     Args:
         document_id: Document UUID
         current_user: Current authenticated user
         db: Database session
+        limit: Maximum number of chunks to return
+        after_index: Keyset cursor from the previous page's next_cursor
 
     Returns:
         ChunkListResponse: List of chunks
     """
-    try:
-        document = get_document_with_ownership(db, document_id, current_user.id)
-
-        # Get all chunks for this document
-        stmt = (
-            select(DocumentChunk)
-            .where(DocumentChunk.document_id == document.id)
-            .order_by(DocumentChunk.chunk_index)
+    document = get_document_with_ownership(db, document_id, current_user.id)
+
+    # Document's chunk count, evaluated once per query and not narrowed by the cursor
+    total = select(func.count()).where(DocumentChunk.document_id == document.id).scalar_subquery()
+
+    # Get one page of chunks for this document (keyset on chunk_index)
+    # Project the embedding dimension in SQL instead of loading the vectors
+    stmt = (
+        select(
+            DocumentChunk.id,
+            DocumentChunk.document_id,
+            DocumentChunk.chunk_index,
+            DocumentChunk.content,
+            DocumentChunk.created_at,
+            DocumentChunk.chunk_metadata,
+            func.vector_dims(DocumentChunk.embedding).label("embedding_dim"),
+            total.label("total"),
         )
-        result = db.execute(stmt)
-        chunks = result.scalars().all()
-
-        chunk_items = []
-        for chunk in chunks:
-            embedding_dim = None
-            if chunk.embedding is not None:
-                # Get embedding dimension from the vector
-                embedding_dim = (
-                    len(chunk.embedding) if hasattr(chunk.embedding, "__len__") else None
-                )
-
-            chunk_items.append(
-                ChunkListItem(
-                    id=str(chunk.id),
-                    document_id=str(chunk.document_id),
-                    chunk_index=chunk.chunk_index,
-                    content=chunk.content,
-                    created_at=chunk.created_at.isoformat(),
-                    metadata=chunk.chunk_metadata or {},
-                    embedding_dimension=embedding_dim,
-                )
-            )
-
-        return ChunkListResponse(
-            chunks=chunk_items,
-            total=len(chunk_items),
-            document_id=str(document.id),
-            document_name=document.file_name,
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to list chunks: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list chunks: {str(e)}",
+        .where(DocumentChunk.document_id == document.id)
+        .order_by(DocumentChunk.chunk_index)
+        # Fetch one extra row to know whether another page exists
+        .limit(limit + 1)
+    )
+    if after_index is not None:
+        stmt = stmt.where(DocumentChunk.chunk_index > after_index)
+    result = db.execute(stmt)
+    rows = result.all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    # Trusted data from our own rows: skip validation with model_construct
+    chunk_items = [
+        ChunkListItem.model_construct(
+            id=row.id,
+            document_id=row.document_id,
+            chunk_index=row.chunk_index,
+            content=row.content,
+            created_at=row.created_at,
+            metadata=row.chunk_metadata or {},
+            embedding_dimension=row.embedding_dim,
         )
+        for row in rows
+    ]
+
+    return ChunkListResponse.model_construct(
+        chunks=chunk_items,
+        # An empty page past the last chunk carries no row to read the total from
+        total=rows[0].total if rows else db.scalar(select(total)),
+        document_id=document.id,
+        document_name=document.file_name,
+        has_more=has_more,
+        next_cursor=rows[-1].chunk_index if has_more else None,
+    )
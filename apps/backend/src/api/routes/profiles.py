@@ -4,7 +4,7 @@ Profile routes for managing prompt profiles.
 
 import uuid
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, status
 
 from src.api.deps import CurrentUser, DBSession
 from src.api.schemas.profile import (
@@ -35,17 +35,7 @@ def list_profiles(
     """
     profiles = profile_service.get_user_profiles(db=db, user_id=current_user.id)
 
-    return [
-        ProfileResponse(
-            id=str(profile.id),
-            name=profile.name,
-            description=profile.description,
-            is_default=profile.is_default,
-            created_at=profile.created_at,
-            updated_at=profile.updated_at,
-        )
-        for profile in profiles
-    ]
+    return [ProfileResponse.model_validate(profile) for profile in profiles]
 
 
 @router.get("/default", response_model=ProfileDetailResponse)
@@ -65,30 +55,12 @@ def get_default_profile(
     """
     profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
 
-    return ProfileDetailResponse(
-        id=str(profile.id),
-        name=profile.name,
-        description=profile.description,
-        is_default=profile.is_default,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        system_prompt=profile.system_prompt,
-        rag_system_prompt_template=profile.rag_system_prompt_template,
-        chunk_size=profile.chunk_size,
-        chunk_overlap=profile.chunk_overlap,
-        top_k_chunks=profile.top_k_chunks,
-        semantic_search_ratio=profile.semantic_search_ratio,
-        relevance_threshold=profile.relevance_threshold,
-        llm_model_id=profile.llm_model_id,
-        llm_temperature=profile.llm_temperature,
-        llm_top_p=profile.llm_top_p,
-        llm_max_tokens=profile.llm_max_tokens,
-    )
+    return ProfileDetailResponse.model_validate(profile)
 
 
 @router.get("/{profile_id}", response_model=ProfileDetailResponse)
 def get_profile(
-    profile_id: str,
+    profile_id: uuid.UUID,
     db: DBSession,
     current_user: CurrentUser,
 ) -> ProfileDetailResponse:
@@ -108,37 +80,17 @@ def get_profile(
     """
     profile = profile_service.get_profile_by_id(
         db=db,
-        profile_id=uuid.UUID(profile_id),
+        profile_id=profile_id,
         user_id=current_user.id,
     )
 
     if not profile:
-        from fastapi import HTTPException
-
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found",
         )
 
-    return ProfileDetailResponse(
-        id=str(profile.id),
-        name=profile.name,
-        description=profile.description,
-        is_default=profile.is_default,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        system_prompt=profile.system_prompt,
-        rag_system_prompt_template=profile.rag_system_prompt_template,
-        chunk_size=profile.chunk_size,
-        chunk_overlap=profile.chunk_overlap,
-        top_k_chunks=profile.top_k_chunks,
-        semantic_search_ratio=profile.semantic_search_ratio,
-        relevance_threshold=profile.relevance_threshold,
-        llm_model_id=profile.llm_model_id,
-        llm_temperature=profile.llm_temperature,
-        llm_top_p=profile.llm_top_p,
-        llm_max_tokens=profile.llm_max_tokens,
-    )
+    return ProfileDetailResponse.model_validate(profile)
 
 
 @router.post("", response_model=ProfileDetailResponse, status_code=status.HTTP_201_CREATED)
@@ -179,30 +131,12 @@ def create_profile(
         llm_max_tokens=request.llm_max_tokens,
     )
 
-    return ProfileDetailResponse(
-        id=str(profile.id),
-        name=profile.name,
-        description=profile.description,
-        is_default=profile.is_default,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        system_prompt=profile.system_prompt,
-        rag_system_prompt_template=profile.rag_system_prompt_template,
-        chunk_size=profile.chunk_size,
-        chunk_overlap=profile.chunk_overlap,
-        top_k_chunks=profile.top_k_chunks,
-        semantic_search_ratio=profile.semantic_search_ratio,
-        relevance_threshold=profile.relevance_threshold,
-        llm_model_id=profile.llm_model_id,
-        llm_temperature=profile.llm_temperature,
-        llm_top_p=profile.llm_top_p,
-        llm_max_tokens=profile.llm_max_tokens,
-    )
+    return ProfileDetailResponse.model_validate(profile)
 
 
 @router.put("/{profile_id}", response_model=ProfileDetailResponse)
 def update_profile(
-    profile_id: str,
+    profile_id: uuid.UUID,
     request: ProfileUpdateRequest,
     db: DBSession,
     current_user: CurrentUser,
@@ -224,7 +158,7 @@ def update_profile(
     """
     profile = profile_service.update_profile(
         db=db,
-        profile_id=uuid.UUID(profile_id),
+        profile_id=profile_id,
         user_id=current_user.id,
         name=request.name,
         description=request.description,
@@ -241,30 +175,12 @@ def update_profile(
         llm_max_tokens=request.llm_max_tokens,
     )
 
-    return ProfileDetailResponse(
-        id=str(profile.id),
-        name=profile.name,
-        description=profile.description,
-        is_default=profile.is_default,
-        created_at=profile.created_at,
-        updated_at=profile.updated_at,
-        system_prompt=profile.system_prompt,
-        rag_system_prompt_template=profile.rag_system_prompt_template,
-        chunk_size=profile.chunk_size,
-        chunk_overlap=profile.chunk_overlap,
-        top_k_chunks=profile.top_k_chunks,
-        semantic_search_ratio=profile.semantic_search_ratio,
-        relevance_threshold=profile.relevance_threshold,
-        llm_model_id=profile.llm_model_id,
-        llm_temperature=profile.llm_temperature,
-        llm_top_p=profile.llm_top_p,
-        llm_max_tokens=profile.llm_max_tokens,
-    )
+    return ProfileDetailResponse.model_validate(profile)
 
 
 @router.delete("/{profile_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_profile(
-    profile_id: str,
+    profile_id: uuid.UUID,
     db: DBSession,
     current_user: CurrentUser,
 ) -> None:
@@ -281,14 +197,14 @@ def delete_profile(
     """
     profile_service.delete_profile(
         db=db,
-        profile_id=uuid.UUID(profile_id),
+        profile_id=profile_id,
         user_id=current_user.id,
     )
 
 
 @router.post("/{profile_id}/set-default", status_code=status.HTTP_200_OK)
 def set_default_profile(
-    profile_id: str,
+    profile_id: uuid.UUID,
     db: DBSession,
     current_user: CurrentUser,
 ) -> dict:
@@ -308,7 +224,7 @@ def set_default_profile(
     """
     profile_service.set_default_profile(
         db=db,
-        profile_id=uuid.UUID(profile_id),
+        profile_id=profile_id,
         user_id=current_user.id,
     )
 
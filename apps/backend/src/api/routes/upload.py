@@ -8,14 +8,31 @@ This module provides endpoints for:
 4. Managing documents (list, delete)
 """
 
+import functools
+import hashlib
 import logging
-import os
-import shutil
 import uuid
+from datetime import datetime
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, File, Form, HTTPException, Query, UploadFile, status
-from pydantic import BaseModel, Field
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import and_, create_engine, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from src.api.deps import CurrentUser, DBSession
 from src.core.config import settings
@@ -26,7 +43,7 @@ from src.services.s3_service import get_s3_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/upload", tags=["upload"])
+router = APIRouter(prefix="/upload", tags=["upload"], default_response_class=ORJSONResponse)
 
 
 # ========== Request/Response Models ==========
@@ -41,6 +58,11 @@ class PresignedUrlRequest(BaseModel):
         ..., ge=1, le=50 * 1024 * 1024, description="File size in bytes (max 50MB)"
     )
     profile_id: str | None = Field(None, description="Profile ID (uses default if not provided)")
+    idempotency_key: uuid.UUID | None = Field(
+        None,
+        description="Client-generated key for this upload; retries sending the same key "
+        "reuse its pending document instead of creating another",
+    )
 
 
 class PresignedUrlResponse(BaseModel):
@@ -56,7 +78,7 @@ class PresignedUrlResponse(BaseModel):
 class ProcessDocumentRequest(BaseModel):
     """Request model to trigger document processing."""
 
-    document_id: str = Field(..., description="UUID of the document to process")
+    document_id: uuid.UUID = Field(..., description="UUID of the document to process")
 
 
 class ProcessDocumentResponse(BaseModel):
@@ -70,12 +92,14 @@ class ProcessDocumentResponse(BaseModel):
 class DocumentListItem(BaseModel):
     """Document list item model."""
 
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
     file_name: str
     file_type: str
     file_size: int
     storage_type: str
-    upload_date: str
+    upload_date: datetime
     status: str
     error_message: str | None
     chunk_count: int
@@ -108,13 +132,35 @@ class LocalUploadResponse(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+# Validates a whole list of document rows in one pydantic-core call
+_DOCUMENT_LIST_ADAPTER = TypeAdapter(list[DocumentListItem])
+
+# Supported extensions as a set for lookups, plus the error-message listing
+SUPPORTED_FILE_TYPES = frozenset(settings.SUPPORTED_FILE_TYPES)
+SUPPORTED_FILE_TYPES_STR = ", ".join(settings.SUPPORTED_FILE_TYPES)
+
+# Bytes read from an UploadFile per write when saving to local storage
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Upload config only changes on redeploy: serialize it once and serve it with an ETag
+_UPLOAD_CONFIG_BODY = (
+    ConfigResponse(use_presigned_urls=settings.USE_PRESIGNED_URLS).model_dump_json().encode()
+)
+_UPLOAD_CONFIG_ETAG = f'"{hashlib.md5(_UPLOAD_CONFIG_BODY).hexdigest()}"'
+_UPLOAD_CONFIG_HEADERS = {"ETag": _UPLOAD_CONFIG_ETAG, "Cache-Control": "private, max-age=60"}
+
+
 # ========== Helper Functions ==========
 
 
+@functools.cache
 def ensure_upload_directory() -> Path:
     """
     Ensure upload directory exists.
 
+    Cached, so the mkdir runs once per process rather than on every upload
+    (a failure is not cached and is retried on the next call).
+
     Returns:
         Path object for the upload directory
 
@@ -134,6 +180,23 @@ def ensure_upload_directory() -> Path:
 # ========== Background Processing ==========
 
 
+@functools.lru_cache(maxsize=4)
+def _get_sessionmaker(db_url: str) -> sessionmaker:
+    """
+    Get a sessionmaker for background tasks, building its engine once per URL.
+
+    Args:
+        db_url: Database URL
+
+    Returns:
+        sessionmaker: Session factory bound to a cached engine
+    """
+    engine = create_engine(
+        db_url, pool_size=5, max_overflow=10, pool_pre_ping=True, pool_recycle=1800
+    )
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
 def process_uploaded_document(
     document_id: uuid.UUID,
     file_path: str,
@@ -144,12 +207,10 @@ def process_uploaded_document(
     Background task to process document from S3 or local storage.
 
     This function:
-    1. For S3 paths: Downloads file from S3 to /tmp
-    2. For local paths: Uses file directly
-    3. Creates new database session
-    4. Calls DocumentProcessor.process_document_sync()
-    5. Updates document status on success or failure
-    6. Cleans up temp file (for S3 only, local files are kept)
+    1. Creates new database session
+    2. Calls DocumentProcessor.process_document_sync(), which reads the S3
+       object or local file (a missing file marks the document failed)
+    3. Updates document status on success or failure
 
     Args:
         document_id: Document UUID
@@ -157,53 +218,16 @@ def process_uploaded_document(
         file_type: File extension
         db_url: Database URL for creating new session
     """
-    import tempfile
-
-    import boto3
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-
-    temp_file_path = None
-    is_s3_file = file_path.startswith("s3://")
-
     try:
         logger.info(f"Background processing started for document: {document_id}")
 
-        # Handle S3 files - download to temp location
-        if is_s3_file:
-            # Parse S3 path (s3://bucket/key)
-            s3_path_parts = file_path[5:].split("/", 1)
-            if len(s3_path_parts) != 2:
-                raise ValueError(f"Invalid S3 path format: {file_path}")
-
-            bucket_name = s3_path_parts[0]
-            s3_key = s3_path_parts[1]
-
-            # Download file from S3 to temp location
-            s3_client = boto3.client("s3", region_name=settings.AWS_REGION)
-            # Use NamedTemporaryFile for secure temp file creation
-            with tempfile.NamedTemporaryFile(suffix=f".{file_type}", delete=False) as temp_file:
-                temp_file_path = temp_file.name
-
-            logger.info(f"Downloading {file_path} to {temp_file_path}")
-            s3_client.download_file(bucket_name, s3_key, temp_file_path)
-            processing_file_path = temp_file_path
-        else:
-            # Local file - use directly
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Local file not found: {file_path}")
-            processing_file_path = file_path
-            logger.info(f"Processing local file: {file_path}")
-
         # Create new database session for background task
-        engine = create_engine(db_url)
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        db = SessionLocal()
+        db = _get_sessionmaker(db_url)()
 
         try:
             # Process document
             processor = DocumentProcessor(db)
-            result = processor.process_document_sync(document_id, processing_file_path, file_type)
+            result = processor.process_document_sync(document_id, file_path, file_type)
             logger.info(f"Document processed successfully: {result}")
         finally:
             db.close()
@@ -213,42 +237,44 @@ def process_uploaded_document(
 
         # Update document status to failed
         try:
-            engine = create_engine(db_url)
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-            db = SessionLocal()
+            db = _get_sessionmaker(db_url)()
             try:
-                document = db.query(Document).filter(Document.id == document_id).first()
-                if document:
-                    document.status = "failed"
-                    document.error_message = str(e)
-                    db.commit()
+                db.execute(
+                    update(Document)
+                    .where(Document.id == document_id)
+                    .values(status="failed", error_message=str(e))
+                )
+                db.commit()
             finally:
                 db.close()
         except Exception as update_error:
             logger.error(f"Failed to update document status: {update_error}")
 
-    finally:
-        # Clean up temp file (only for S3 downloads)
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.unlink(temp_file_path)
-                logger.debug(f"Cleaned up temp file: {temp_file_path}")
-            except Exception as cleanup_error:
-                logger.warning(f"Failed to delete temp file {temp_file_path}: {cleanup_error}")
-
 
 # ========== API Endpoints ==========
 
 
 @router.get("/config", response_model=ConfigResponse)
-def get_upload_config() -> ConfigResponse:
+def get_upload_config(request: Request) -> Response:
     """
     Get upload configuration to determine upload mode.
 
+    The body is precomputed at import time; clients revalidating with
+    If-None-Match get an empty 304 when the config is unchanged.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+
     Returns:
-        ConfigResponse: Upload configuration including USE_PRESIGNED_URLS setting
+        Response: Upload configuration including USE_PRESIGNED_URLS setting
     """
-    return ConfigResponse(use_presigned_urls=settings.USE_PRESIGNED_URLS)
+    if request.headers.get("if-none-match") == _UPLOAD_CONFIG_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=_UPLOAD_CONFIG_HEADERS)
+    return Response(
+        content=_UPLOAD_CONFIG_BODY,
+        media_type="application/json",
+        headers=_UPLOAD_CONFIG_HEADERS,
+    )
 
 
 @router.post("/local", response_model=LocalUploadResponse)
@@ -275,104 +301,97 @@ async def upload_local_file(
     Returns:
         LocalUploadResponse: Upload status and document ID
     """
-    try:
-        # Get profile: use specified profile_id or default profile
-        if profile_id:
-            profile = profile_service.get_profile_by_id(
-                db=db,
-                profile_id=uuid.UUID(profile_id),
-                user_id=current_user.id,
-            )
-            if not profile:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Profile not found",
-                )
-        else:
-            profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
-
-        # Validate file type
-        if not file.filename:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Filename is required",
-            )
-
-        file_extension = file.filename.split(".")[-1].lower()
-        if file_extension not in settings.SUPPORTED_FILE_TYPES:
-            supported_types = ", ".join(settings.SUPPORTED_FILE_TYPES)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported file type: {file_extension}. Supported: {supported_types}",
-            )
-
-        # Ensure upload directory exists
-        upload_dir = ensure_upload_directory()
-
-        # Create document record
-        document_id = uuid.uuid4()
-        unique_filename = f"{document_id}_{file.filename}"
-        file_path = upload_dir / unique_filename
-
-        # Save file to disk
-        try:
-            with file_path.open("wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            logger.info(f"Saved file to local storage: {file_path}")
-        except Exception as e:
-            logger.error(f"Failed to save file {file_path}: {e}")
+    # Get profile: use specified profile_id or default profile
+    if profile_id:
+        profile = profile_service.get_profile_by_id(
+            db=db,
+            profile_id=uuid.UUID(profile_id),
+            user_id=current_user.id,
+        )
+        if not profile:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to save file: {str(e)}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found",
             )
+        profile_uuid = profile.id
+    else:
+        profile_uuid = profile_service.get_default_profile_id(current_user)
 
-        # Get file size
-        file_size = file_path.stat().st_size
-
-        # Create document record in database
-        document = Document(
-            id=document_id,
-            user_id=current_user.id,
-            profile_id=profile.id,
-            file_name=file.filename,
-            file_path=str(file_path.absolute()),
-            file_type=file_extension,
-            file_size=file_size,
-            storage_type="local",
-            status="pending",
+    # Validate file type
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Filename is required",
         )
-        db.add(document)
-        db.commit()
-        db.refresh(document)
-
-        logger.info(f"Created document record: {document_id}")
-
-        # Trigger background processing immediately
-        background_tasks.add_task(
-            process_uploaded_document,
-            document_id=document_id,
-            file_path=str(file_path.absolute()),
-            file_type=file_extension,
-            db_url=settings.DATABASE_URL,
+
+    file_extension = file.filename.rpartition(".")[2].lower()
+    if file_extension not in SUPPORTED_FILE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type: {file_extension}. Supported: {SUPPORTED_FILE_TYPES_STR}",
         )
 
-        logger.info(f"Triggered processing for local file: {document_id}")
+    # Ensure upload directory exists (first call does the mkdir, off the event loop)
+    upload_dir = await run_in_threadpool(ensure_upload_directory)
 
-        return LocalUploadResponse(
-            document_id=str(document_id),
-            status="processing",
-            message="File uploaded successfully and processing started",
-        )
+    # Create document record
+    document_id = uuid.uuid4()
+    unique_filename = f"{document_id}_{file.filename}"
+    file_path = upload_dir / unique_filename
 
-    except HTTPException:
-        raise
+    # Stream file to disk one chunk at a time; open, writes and close run off
+    # the event loop and the size is counted as we go (no stat() afterwards)
+    file_size = 0
+    try:
+        buffer = await run_in_threadpool(file_path.open, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await run_in_threadpool(buffer.write, chunk)
+                file_size += len(chunk)
+        finally:
+            await run_in_threadpool(buffer.close)
+        logger.info(f"Saved file to local storage: {file_path}")
     except Exception as e:
-        logger.error(f"Failed to upload local file: {e}", exc_info=True)
+        logger.error(f"Failed to save file {file_path}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to upload file: {str(e)}",
+            detail=f"Failed to save file: {str(e)}",
         )
 
+    # Create document record in database
+    document = Document(
+        id=document_id,
+        user_id=current_user.id,
+        profile_id=profile_uuid,
+        file_name=file.filename,
+        file_path=str(file_path.absolute()),
+        file_type=file_extension,
+        file_size=file_size,
+        storage_type="local",
+        status="pending",
+    )
+    db.add(document)
+    db.commit()
+
+    logger.info(f"Created document record: {document_id}")
+
+    # Trigger background processing immediately
+    background_tasks.add_task(
+        process_uploaded_document,
+        document_id=document_id,
+        file_path=str(file_path.absolute()),
+        file_type=file_extension,
+        db_url=settings.DATABASE_URL,
+    )
+
+    logger.info(f"Triggered processing for local file: {document_id}")
+
+    return LocalUploadResponse(
+        document_id=str(document_id),
+        status="processing",
+        message="File uploaded successfully and processing started",
+    )
+
 
 @router.post("/presigned-url", response_model=PresignedUrlResponse)
 def get_presigned_upload_url(
@@ -385,7 +404,8 @@ def get_presigned_upload_url(
 
     This endpoint:
     1. Validates file type and size
-    2. Creates Document record with status='pending'
+    2. Creates Document record with status='pending' (a retry with the same
+       idempotency_key reuses its pending record instead of adding another)
     3. Generates pre-signed S3 POST URL
     4. Returns URL and required form fields
 
@@ -397,82 +417,87 @@ def get_presigned_upload_url(
     Returns:
         PresignedUrlResponse: Pre-signed URL and upload details
     """
-    try:
-        # Get profile: use specified profile_id or default profile
-        if request.profile_id:
-            profile = profile_service.get_profile_by_id(
-                db=db,
-                profile_id=uuid.UUID(request.profile_id),
-                user_id=current_user.id,
-            )
-            if not profile:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Profile not found",
-                )
-        else:
-            profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
-
-        # Validate file type
-        file_type = request.file_type.lower().lstrip(".")
-        if file_type not in settings.SUPPORTED_FILE_TYPES:
-            supported_types = ", ".join(settings.SUPPORTED_FILE_TYPES)
+    # Get profile: use specified profile_id or default profile
+    if request.profile_id:
+        profile = profile_service.get_profile_by_id(
+            db=db,
+            profile_id=uuid.UUID(request.profile_id),
+            user_id=current_user.id,
+        )
+        if not profile:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported file type: {file_type}. Supported: {supported_types}",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Profile not found",
             )
+        profile_uuid = profile.id
+    else:
+        profile_uuid = profile_service.get_default_profile_id(current_user)
 
-        # Create document record with status='pending'
-        document_id = uuid.uuid4()
-        document = Document(
-            id=document_id,
-            user_id=current_user.id,
-            profile_id=profile.id,
-            file_name=request.filename,
-            file_path="",  # Will be set after S3 upload
-            file_type=file_type,
-            file_size=request.file_size,
-            storage_type="cloud",
-            status="pending",
+    # Validate file type
+    file_type = request.file_type.lower().lstrip(".")
+    if file_type not in SUPPORTED_FILE_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported file type: {file_type}. Supported: {SUPPORTED_FILE_TYPES_STR}",
         )
-        db.add(document)
-        db.commit()
-        db.refresh(document)
 
-        logger.info(f"Created pending document record: {document_id}")
+    # Generate pre-signed URL first (signed locally, no S3 round trip) so the
+    # document row is inserted once with its final S3 path
+    document_id = uuid.uuid4()
+    s3_service = get_s3_service()
+    presigned_data = s3_service.generate_presigned_upload_url(
+        document_id=str(document_id),
+        filename=request.filename,
+        file_type=file_type,
+        expiration=300,  # 5 minutes
+    )
 
-        # Generate pre-signed URL
-        s3_service = get_s3_service()
+    # Create document record with status='pending'. A retried request with the
+    # same idempotency key hits uniq_pending_cloud_document and reuses the pending
+    # row; without a key (NULL never conflicts) every request gets its own row
+    insert_stmt = pg_insert(Document).values(
+        id=document_id,
+        user_id=current_user.id,
+        profile_id=profile_uuid,
+        file_name=request.filename,
+        file_path=presigned_data["s3_path"],
+        file_type=file_type,
+        file_size=request.file_size,
+        storage_type="cloud",
+        status="pending",
+        upload_key=request.idempotency_key,
+    )
+    stmt = insert_stmt.on_conflict_do_update(
+        index_elements=[Document.user_id, Document.upload_key],
+        index_where=and_(Document.status == "pending", Document.storage_type == "cloud"),
+        set_={"upload_date": insert_stmt.excluded.upload_date},
+    ).returning(Document.id, Document.file_name, Document.file_type)
+    stored = db.execute(stmt).one()
+    db.commit()
+
+    if stored.id != document_id:
+        # Existing pending upload: sign a fresh URL from the stored row, so the
+        # key and content type match its file_path even if the retry differs
+        document_id = stored.id
         presigned_data = s3_service.generate_presigned_upload_url(
             document_id=str(document_id),
-            filename=request.filename,
-            file_type=file_type,
-            expiration=300,  # 5 minutes
-        )
-
-        # Update document with S3 path
-        document.file_path = presigned_data["s3_path"]
-        db.commit()
-
-        logger.info(f"Generated pre-signed URL for document: {document_id}")
-        logger.info(f"Presigned URL: {presigned_data['url']}")
-
-        return PresignedUrlResponse(
-            document_id=str(document_id),
-            upload_url=presigned_data["url"],
-            s3_key=presigned_data["s3_key"],
-            content_type=presigned_data["content_type"],
-            expires_in=300,
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to generate pre-signed URL: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to generate upload URL: {str(e)}",
+            filename=stored.file_name,
+            file_type=stored.file_type,
+            expiration=300,
         )
+        logger.info(f"Reusing pending document record: {document_id}")
+    else:
+        logger.info(f"Created pending document record: {document_id}")
+    logger.info(f"Generated pre-signed URL for document: {document_id}")
+    logger.info(f"Presigned URL: {presigned_data['url']}")
+
+    return PresignedUrlResponse(
+        document_id=str(document_id),
+        upload_url=presigned_data["url"],
+        s3_key=presigned_data["s3_key"],
+        content_type=presigned_data["content_type"],
+        expires_in=300,
+    )
 
 
 @router.post("/process-document", response_model=ProcessDocumentResponse)
@@ -499,72 +524,53 @@ def trigger_document_processing(
     Returns:
         ProcessDocumentResponse: Processing status
     """
-    try:
-        # Validate UUID
-        try:
-            doc_uuid = uuid.UUID(request.document_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid document ID format",
-            )
-
-        # Get document from database
-        document = (
-            db.query(Document)
-            .filter(
-                Document.id == doc_uuid,
-                Document.user_id == current_user.id,
-            )
-            .first()
+    # Get only the columns needed to validate and dispatch the document
+    document = (
+        db.query(Document.status, Document.file_path, Document.file_type)
+        .filter(
+            Document.id == request.document_id,
+            Document.user_id == current_user.id,
         )
+        .first()
+    )
 
-        if not document:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Document not found or not authorized",
-            )
-
-        # Verify document is in pending state
-        if document.status != "pending":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Document is not in pending state (current: {document.status})",
-            )
-
-        # Verify file path exists (S3 or local)
-        if not document.file_path:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Document does not have a valid file path",
-            )
-
-        # Trigger background processing
-        background_tasks.add_task(
-            process_uploaded_document,
-            document_id=doc_uuid,
-            file_path=document.file_path,
-            file_type=document.file_type,
-            db_url=settings.DATABASE_URL,
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found or not authorized",
         )
 
-        logger.info(f"Triggered processing for document: {doc_uuid}")
-
-        return ProcessDocumentResponse(
-            document_id=str(doc_uuid),
-            status="processing",
-            message="Document processing started in background",
+    # Verify document is in pending state
+    if document.status != "pending":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Document is not in pending state (current: {document.status})",
         )
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to trigger processing for {request.document_id}: {e}", exc_info=True)
+    # Verify file path exists (S3 or local)
+    if not document.file_path:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to trigger document processing: {str(e)}",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Document does not have a valid file path",
         )
 
+    # Trigger background processing
+    background_tasks.add_task(
+        process_uploaded_document,
+        document_id=request.document_id,
+        file_path=document.file_path,
+        file_type=document.file_type,
+        db_url=settings.DATABASE_URL,
+    )
+
+    logger.info(f"Triggered processing for document: {request.document_id}")
+
+    return ProcessDocumentResponse(
+        document_id=str(request.document_id),
+        status="processing",
+        message="Document processing started in background",
+    )
+
 
 @router.get("/documents", response_model=DocumentListResponse)
 def list_documents(
@@ -583,32 +589,23 @@ def list_documents(
     Returns:
         DocumentListResponse: List of documents
     """
-    try:
-        # If profile_id not provided, use default profile
-        if not profile_id:
-            default_profile = profile_service.get_default_profile(db=db, user_id=current_user.id)
-            profile_uuid = default_profile.id
-        else:
-            profile_uuid = uuid.UUID(profile_id)
-
-        documents = get_user_documents(db, current_user.id, profile_uuid)
-
-        return DocumentListResponse(
-            documents=[DocumentListItem(**doc) for doc in documents],
-            total=len(documents),
-        )
+    # If profile_id not provided, use default profile
+    if not profile_id:
+        profile_uuid = profile_service.get_default_profile_id(current_user)
+    else:
+        profile_uuid = uuid.UUID(profile_id)
 
-    except Exception as e:
-        logger.error(f"Failed to list documents: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to list documents: {str(e)}",
-        )
+    documents = get_user_documents(db, current_user.id, profile_uuid)
+
+    return DocumentListResponse(
+        documents=_DOCUMENT_LIST_ADAPTER.validate_python(documents),
+        total=len(documents),
+    )
 
 
 @router.delete("/documents/{document_id}", response_model=DeleteResponse)
 def delete_document_endpoint(
-    document_id: str,
+    document_id: uuid.UUID,
     current_user: CurrentUser,
     db: DBSession,
 ) -> DeleteResponse:
@@ -623,32 +620,13 @@ def delete_document_endpoint(
     Returns:
         DeleteResponse: Deletion confirmation
     """
-    try:
-        # Validate UUID
-        try:
-            doc_uuid = uuid.UUID(document_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid document ID format",
-            )
-
-        # Delete document
-        deleted = delete_document(db, doc_uuid, current_user.id)
+    # Delete document
+    deleted = delete_document(db, document_id, current_user.id)
 
-        if not deleted:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Document not found or not authorized",
-            )
-
-        return DeleteResponse(message="Document deleted successfully")
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to delete document {document_id}: {e}")
+    if not deleted:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to delete document: {str(e)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Document not found or not authorized",
         )
+
+    return DeleteResponse(message="Document deleted successfully")
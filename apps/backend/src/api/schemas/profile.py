@@ -2,6 +2,7 @@
 Pydantic schemas for prompt profile API.
 """
 
+import uuid
 from datetime import datetime
 
 from pydantic import BaseModel, Field
@@ -99,7 +100,7 @@ class ProfileUpdateRequest(BaseModel):
 class ProfileResponse(BaseModel):
     """Response model for profile list (summary without prompts)."""
 
-    id: str
+    id: uuid.UUID
     name: str
     description: str | None
     is_default: bool
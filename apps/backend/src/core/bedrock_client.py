@@ -5,11 +5,14 @@ This module provides a wrapper around AWS Bedrock services using standard AWS cr
 Authentication is handled via boto3's default credential chain (IAM roles, aws-vault, etc.)
 """
 
-import json
+import functools
 import logging
-import time
+from collections.abc import Iterator
+from typing import Any
 
 import boto3
+import numpy as np
+import orjson
 from botocore.config import Config
 from langchain_aws import ChatBedrock
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
@@ -19,6 +22,47 @@ from src.models.conversation import Message
 
 logger = logging.getLogger(__name__)
 
+# Number of recent query embeddings kept in memory; repeated chat queries skip
+# the Bedrock round-trip (6 KB per 1536-dim float32 vector, ~6 MB when full)
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+# Conversation models that take Converse prompt-cache points: ChatBedrock sends
+# Nova models through the Converse API, and other models reject cachePoint blocks
+PROMPT_CACHE_MODEL_MARKER = "amazon.nova"
+
+
+@functools.cache
+def get_bedrock_runtime() -> Any:
+    """
+    Get or create the shared bedrock-runtime boto3 client.
+
+    boto3 clients are thread-safe, so one client serves every BedrockClient and
+    the concurrent embedding batches, keeping TLS connections warm across requests.
+
+    Returns:
+        The process-wide bedrock-runtime client
+    """
+    # When using aws-vault, credentials are set via environment variables,
+    # so we only specify the region and let boto3 use the default credential chain
+    session = boto3.Session(region_name=settings.AWS_REGION)
+
+    # Configure retry strategy with exponential backoff for throttling
+    retry_config = Config(
+        retries={
+            "max_attempts": 8,  # Increased from default 4
+            "mode": "adaptive",  # Adaptive mode adjusts retry behavior based on success/failure
+        },
+        # Add connection timeout and read timeout
+        connect_timeout=30,
+        read_timeout=60,
+        # Keep a warm connection per concurrent embedding batch so parallel
+        # requests reuse TLS sessions instead of discarding overflow connections
+        max_pool_connections=max(10, settings.EMBEDDING_MAX_CONCURRENCY),
+        tcp_keepalive=True,
+    )
+
+    return session.client("bedrock-runtime", config=retry_config)
+
 
 class BedrockClient:
     """Client for interacting with Amazon Bedrock services."""
@@ -41,27 +85,9 @@ class BedrockClient:
         """
         logger.info("Initializing Bedrock client with AWS credentials")
 
-        # Initialize boto3 session
-        # When using aws-vault, credentials are set via environment variables,
-        # so we only specify the region and let boto3 use the default credential chain
-        self.session = boto3.Session(region_name=settings.AWS_REGION)
-
-        # Configure retry strategy with exponential backoff for throttling
-        retry_config = Config(
-            retries={
-                "max_attempts": 8,  # Increased from default 4
-                "mode": "adaptive",  # Adaptive mode adjusts retry behavior based on success/failure
-            },
-            # Add connection timeout and read timeout
-            connect_timeout=30,
-            read_timeout=60,
-        )
-
-        # Initialize bedrock-runtime client (shared by all LLM instances)
-        self.bedrock_runtime = self.session.client(
-            "bedrock-runtime",
-            config=retry_config,
-        )
+        # Share one bedrock-runtime client (and its connection pool) across all
+        # instances, including the per-profile clients built for each chat request
+        self.bedrock_runtime = get_bedrock_runtime()
 
         # Use custom settings or defaults from config
         conversation_model_id = model_id or settings.CONVERSATION_LLM_MODEL_ID
@@ -156,12 +182,51 @@ class BedrockClient:
             logger.error(f"Failed to invoke LLM: {e}")
             raise
 
+    def stream_llm(
+        self,
+        user_message: str,
+        conversation_history: list[Message],
+        system_prompt: str,
+    ) -> Iterator[str]:
+        """
+        Stream the conversation LLM response with conversation history.
+
+        Args:
+            user_message: The current user message
+            conversation_history: List of previous messages in the conversation
+            system_prompt: System prompt to guide the model's behavior
+
+        Yields:
+            Response text chunks as they are generated
+
+        Raises:
+            Exception: If the Bedrock API call fails
+        """
+        # Convert conversation history to LangChain message format
+        messages = self._format_conversation_history(conversation_history, system_prompt)
+
+        # Let the provider reuse the prefill of the unchanged prefix across turns
+        if PROMPT_CACHE_MODEL_MARKER in self.conversation_llm.model_id:
+            self._add_prompt_cache_points(messages)
+
+        # Add the current user message
+        messages.append(HumanMessage(content=user_message))
+
+        logger.debug(f"Streaming LLM with {len(messages)} messages (including system prompt)")
+
+        # Converse models stream content as a list of blocks; only the text is wanted
+        for chunk in self.conversation_llm.stream(messages):
+            text = chunk.text
+            if text:
+                yield text
+
     def generate_embeddings(
         self,
         texts: list[str],
         input_type: str = "search_document",
         batch_size: int = 96,
-    ) -> list[list[float]]:
+        model_id: str | None = None,
+    ) -> np.ndarray:
         """
         Generate embeddings for a list of texts using Cohere Embed v4.
 
@@ -171,19 +236,24 @@ class BedrockClient:
                 - "search_document": For document chunks (default)
                 - "search_query": For search queries
             batch_size: Maximum number of texts to process in one API call (max 96)
+            model_id: Optional embedding model ID (defaults to EMBEDDING_MODEL_ID)
 
         Returns:
-            List of embedding vectors (1024 dimensions each)
+            float32 array of shape (len(texts), EMBEDDING_DIMENSION), one row per text
 
         Raises:
             Exception: If the Bedrock API call fails
         """
+        model_id = model_id or settings.EMBEDDING_MODEL_ID
+
+        # Rows are filled in place as batches return, so vectors are stored as
+        # contiguous float32 rather than lists of boxed Python floats
+        all_embeddings = np.empty((len(texts), settings.EMBEDDING_DIMENSION), dtype=np.float32)
         if not texts:
-            return []
+            return all_embeddings
 
         # Cohere Embed v4 supports up to 96 texts per request
         batch_size = min(batch_size, 96)
-        all_embeddings = []
 
         try:
             # Process in batches to avoid API limits
@@ -197,11 +267,8 @@ class BedrockClient:
                     f"({len(batch)} texts)"
                 )
 
-                # Add delay between batches to avoid rate limiting (except for first batch)
-                if i > 0:
-                    delay = 0.5  # 500ms delay between batches
-                    logger.debug(f"Adding {delay}s delay to avoid throttling")
-                    time.sleep(delay)
+                # No fixed delay between batches: the client's adaptive retry mode
+                # rate-limits with a token bucket that only backs off on throttling
 
                 # Prepare request body for Cohere Embed v4
                 request_body = {
@@ -213,10 +280,10 @@ class BedrockClient:
                 # Invoke Bedrock model with retry handling
                 try:
                     response = self.bedrock_runtime.invoke_model(
-                        modelId=settings.EMBEDDING_MODEL_ID,
+                        modelId=model_id,
                         contentType="application/json",
                         accept="application/json",
-                        body=json.dumps(request_body),
+                        body=orjson.dumps(request_body),
                     )
                 except Exception as e:
                     # If throttling occurs even with retries, log and re-raise
@@ -228,7 +295,7 @@ class BedrockClient:
                     raise
 
                 # Parse response
-                response_body = json.loads(response["body"].read())
+                response_body = orjson.loads(response["body"].read())
 
                 # Extract embeddings from response
                 # Cohere Embed v4 returns embeddings in 'embeddings' field
@@ -237,7 +304,7 @@ class BedrockClient:
                 if not batch_embeddings:
                     raise ValueError("No embeddings returned from Bedrock API")
 
-                all_embeddings.extend(batch_embeddings)
+                all_embeddings[i : i + len(batch)] = batch_embeddings
 
             logger.info(
                 f"Generated {len(all_embeddings)} embeddings "
@@ -250,21 +317,22 @@ class BedrockClient:
             logger.error(f"Failed to generate embeddings: {e}")
             raise
 
-    def generate_query_embedding(self, query: str) -> list[float]:
+    def generate_query_embedding(self, query: str) -> np.ndarray:
         """
         Generate embedding for a search query.
 
+        Repeated queries are served from an in-process LRU cache without calling Bedrock.
+
         Args:
             query: Search query text
 
         Returns:
-            Embedding vector (1024 dimensions)
+            Read-only float32 embedding vector
 
         Raises:
             Exception: If the Bedrock API call fails
         """
-        embeddings = self.generate_embeddings([query], input_type="search_query")
-        return embeddings[0] if embeddings else []
+        return _embed_query_cached(query, settings.EMBEDDING_MODEL_ID)
 
     def _format_conversation_history(
         self, conversation_history: list[Message], system_prompt: str
@@ -297,6 +365,57 @@ class BedrockClient:
 
         return messages
 
+    @staticmethod
+    def _add_prompt_cache_points(
+        messages: list[SystemMessage | HumanMessage | AIMessage],
+    ) -> None:
+        """
+        Mark the system prompt and conversation history as a cacheable prefix.
+
+        Adds a Converse cachePoint block after the system prompt and after the
+        last history message, so only the new user message is prefilled when the
+        prefix was cached by the previous turn. Prefixes below the model's
+        minimum cacheable length are simply not cached.
+
+        Args:
+            messages: LangChain messages from _format_conversation_history,
+                modified in place
+        """
+        cache_point = {"cachePoint": {"type": "default"}}
+        for index in {0, len(messages) - 1}:
+            message = messages[index]
+            if isinstance(message.content, str) and message.content.strip():
+                messages[index] = message.model_copy(
+                    update={"content": [{"text": message.content}, cache_point]}
+                )
+
+
+@functools.lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def _embed_query_cached(query: str, model_id: str) -> np.ndarray:
+    """
+    Embed a search query, memoized per query text and embedding model.
+
+    Failed calls raise and are not cached. The vector is generated with the
+    model_id in the key, so each entry always belongs to the model it names.
+
+    Args:
+        query: Search query text
+        model_id: Embedding model ID to generate the vector with
+
+    Returns:
+        Read-only float32 embedding vector
+
+    Raises:
+        Exception: If the Bedrock API call fails
+    """
+    embeddings = get_bedrock_client().generate_embeddings(
+        [query], input_type="search_query", model_id=model_id
+    )
+    embedding = embeddings[0]
+    # Shared by every caller that hits the cache, so it must not be mutated
+    embedding.flags.writeable = False
+    return embedding
+
 
 # Global singleton instance
 _bedrock_client: BedrockClient | None = None
@@ -56,6 +56,12 @@ class Settings(BaseSettings):
         default=60 * 24 * 7,
         description="JWT token expiration time in minutes (default: 7 days)",
     )
+    BCRYPT_ROUNDS: int = Field(
+        default=12,
+        description="bcrypt cost factor for new password hashes (each +1 doubles hashing time)",
+        ge=4,
+        le=31,
+    )
 
     # ========== Server Configuration ==========
     UVICORN_HOST: str = Field(
@@ -247,6 +253,17 @@ class Settings(BaseSettings):
         description="Embedding vector dimension (Cohere Embed v4 via Bedrock uses 1536)",
         ge=1,
     )
+    EMBEDDING_BATCH_SIZE: int = Field(
+        default=96,
+        description="Number of texts per Bedrock embedding request (Cohere Embed v4 max 96)",
+        ge=1,
+        le=96,
+    )
+    EMBEDDING_MAX_CONCURRENCY: int = Field(
+        default=4,
+        description="Maximum embedding requests in flight when embedding a document",
+        ge=1,
+    )
 
     @field_validator("UVICORN_PORT")
     @classmethod
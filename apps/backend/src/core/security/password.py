@@ -3,12 +3,19 @@ Password hashing and verification utilities.
 
 Uses SHA256 pre-hashing + bcrypt to support passwords of any length
 while maintaining security against brute-force attacks.
+
+bcrypt.hashpw/checkpw release the GIL, and the auth routes are sync so FastAPI
+runs them in its threadpool: hashing never blocks the event loop and concurrent
+logins run in parallel. Keep these functions sync rather than moving them to a
+process pool, which is unavailable on Lambda (no /dev/shm for multiprocessing).
 """
 
 import hashlib
 
 import bcrypt
 
+from src.core.config import settings
+
 
 def _prehash_password(password: str) -> bytes:
     """
@@ -52,7 +59,8 @@ def get_password_hash(password: str) -> str:
     Hash a password using SHA256 + bcrypt.
 
     Uses SHA256 pre-hashing before bcrypt to support passwords of any length,
-    avoiding bcrypt's 72-byte limit while maintaining security.
+    avoiding bcrypt's 72-byte limit while maintaining security. The cost factor
+    comes from BCRYPT_ROUNDS; existing hashes keep the cost they were created with.
 
     Args:
         password: Plain text password of any length
@@ -62,6 +70,6 @@ def get_password_hash(password: str) -> str:
     """
     prehashed = _prehash_password(password)
     # Generate salt and hash the pre-hashed password
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(prehashed, salt)
     return hashed.decode("utf-8")
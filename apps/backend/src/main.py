@@ -2,12 +2,77 @@
 FastAPI main application.
 """
 
-from fastapi import FastAPI
+import logging
+
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from src.api.routes import auth, chat, embed, profiles, upload
 from src.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+
+class UnexpectedErrorMiddleware:
+    """
+    Turn any unhandled exception into a generic 500 response.
+
+    Routes only raise HTTPException for expected failures (400/404/...); every
+    other error lands here, is logged once with its traceback, and is reported
+    without leaking its message to the client.
+
+    Added before CORSMiddleware so it runs inside it: the 500 still carries the
+    CORS headers and the browser can read the JSON error. An app-level
+    exception handler would run in ServerErrorMiddleware, outside CORS, and
+    re-raise afterwards so the error would also be logged a second time.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """Wrap the inner ASGI app."""
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Run the request, replacing an unhandled exception with a 500 response.
+
+        Args:
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
+
+        Raises:
+            Exception: If the response had already started (e.g. mid-stream),
+                since a new response can no longer be sent
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.error(
+                f"Unhandled error on {scope['method']} {scope['path']}: {exc}", exc_info=exc
+            )
+            response = ORJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={"detail": "Internal server error"},
+            )
+            await response(scope, receive, send)
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.API_TITLE,
@@ -15,6 +80,10 @@ app = FastAPI(
     version=settings.API_VERSION,
 )
 
+
+# Middleware added later wraps the ones added earlier, so CORS is outermost
+app.add_middleware(UnexpectedErrorMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -24,6 +93,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(chat.router)
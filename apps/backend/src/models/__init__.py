@@ -3,13 +3,14 @@ Database models for HR Chatbot RAG system.
 """
 
 from src.models.conversation import Conversation, Message, MessageRole
-from src.models.document import Document, DocumentChunk
+from src.models.document import Document, DocumentChunk, EmbeddingCache
 from src.models.user import User
 
 __all__ = [
     "User",
     "Document",
     "DocumentChunk",
+    "EmbeddingCache",
     "Conversation",
     "Message",
     "MessageRole",
@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, ForeignKey, Index, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -43,6 +43,8 @@ class Conversation(Base):
         index=True,
     )
     title = Column(String(255), nullable=True)  # Optional conversation title
+    # Maintained by the trg_message_count trigger on messages
+    message_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(
         DateTime,
@@ -66,6 +68,7 @@ class Conversation(Base):
     __table_args__ = (
         Index("idx_conversation_user_id", "user_id"),
         Index("idx_conversation_created_at", "created_at"),
+        Index("idx_conv_user_updated", "user_id", "profile_id", updated_at.desc(), id.desc()),
     )
 
     def __repr__(self):
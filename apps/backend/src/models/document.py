@@ -5,8 +5,8 @@ Document and DocumentChunk models for RAG system.
 import uuid
 from datetime import datetime
 
-from pgvector.sqlalchemy import Vector
-from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from pgvector.sqlalchemy import HALFVEC, Vector
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
 from sqlalchemy.orm import relationship
 
@@ -46,6 +46,8 @@ class Document(Base):
         nullable=False,
     )  # pending, processing, completed, failed
     error_message = Column(Text, nullable=True)  # Error details if status is failed
+    # Client-generated idempotency key of a presigned upload, reused on its retries
+    upload_key = Column(UUID(as_uuid=True), nullable=True)
     extra_metadata = Column(JSONB, default={})  # Additional flexible metadata
 
     # Relationships
@@ -56,6 +58,18 @@ class Document(Base):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # One pending presigned upload per idempotency key; retried presigned-URL
+        # requests upsert onto it instead of adding orphan rows
+        Index(
+            "uniq_pending_cloud_document",
+            "user_id",
+            "upload_key",
+            unique=True,
+            postgresql_where=(status == "pending") & (storage_type == "cloud"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Document(id={self.id}, file_name='{self.file_name}')>"
 
@@ -79,10 +93,12 @@ class DocumentChunk(Base):
     chunk_index = Column(Integer, nullable=False)  # Order within document
     content = Column(Text, nullable=False)  # Actual text content
 
-    # Vector embedding for semantic search (Cohere Embed v4 via Bedrock: 1536 dimensions)
-    embedding = Column(Vector(1536))
+    # Vector embedding for semantic search (Cohere Embed v4 via Bedrock: 1536 dimensions),
+    # stored as fp16 halfvec to halve index size and bytes read per similarity probe
+    embedding = Column(HALFVEC(1536))
 
     # Full-text search vector for BM25/TFIDF search
+    # Maintained from content by the trg_chunk_tsvector trigger ('simple' config)
     content_tsvector = Column(TSVECTOR)
 
     # Metadata about the chunk
@@ -104,7 +120,7 @@ class DocumentChunk(Base):
             embedding,
             postgresql_using="ivfflat",
             postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_ops={"embedding": "halfvec_cosine_ops"},
         ),
         # Index for full-text search
         Index("idx_content_tsvector", content_tsvector, postgresql_using="gin"),
@@ -114,3 +130,26 @@ class DocumentChunk(Base):
 
     def __repr__(self):
         return f"<DocumentChunk(id={self.id}, document_id={self.document_id}, chunk_index={self.chunk_index})>"
+
+
+class EmbeddingCache(Base):
+    """
+    Caches embedding vectors by content hash.
+
+    Lets document (re)processing reuse vectors for byte-identical text instead of
+    calling Bedrock again. Keyed by model and input type, since both change the vector.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    content_hash = Column(LargeBinary(32), primary_key=True)  # sha256(content)
+    model_id = Column(String(255), primary_key=True)
+    input_type = Column(String(50), primary_key=True)
+    # Full float32 as returned by Bedrock, unlike the fp16 DocumentChunk.embedding:
+    # the cache is only read by key, and keeping the source vector lets chunk
+    # storage precision change later without re-embedding
+    embedding = Column(Vector(1536), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<EmbeddingCache(model_id='{self.model_id}', input_type='{self.input_type}')>"
@@ -5,7 +5,7 @@ User model for authentication.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Index, String
+from sqlalchemy import Boolean, Column, DateTime, Index, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -36,6 +36,9 @@ class User(Base):
         nullable=False,
     )
 
+    # Not a column: resolved per request alongside the user by get_current_user
+    default_profile_id = None
+
     # Relationships
     conversations = relationship(
         "Conversation",
@@ -55,6 +58,7 @@ class User(Base):
         Index("idx_user_username", "username"),
         Index("idx_user_email", "email"),
         Index("idx_user_is_active", "is_active"),
+        Index("users_email_lower_idx", func.lower(email), unique=True),
     )
 
     def __repr__(self):
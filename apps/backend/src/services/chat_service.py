@@ -2,12 +2,14 @@
 Chat service for handling conversations and messages.
 """
 
+import functools
 import logging
 import uuid
+from collections.abc import Iterator
 from datetime import datetime
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, false, tuple_
+from sqlalchemy.orm import Session, load_only
 
 from src.core.bedrock_client import BedrockClient, get_bedrock_client
 from src.core.config import settings
@@ -16,41 +18,65 @@ from src.models.prompt_profile import PromptProfile
 
 logger = logging.getLogger(__name__)
 
+# Recent generated titles kept in memory, keyed on the first user message, so
+# repeated openers reuse a title instead of another title-LLM round-trip
+TITLE_CACHE_SIZE = 1024
 
-def generate_conversation_title(first_user_message: str) -> str:
+
+@functools.lru_cache(maxsize=TITLE_CACHE_SIZE)
+def _generate_title_with_llm(first_user_message: str) -> str:
     """
-    Generate a conversation title based on the first user message using LLM.
+    Generate and clean up a title with the title LLM, memoized per message.
+
+    The system prompt and title model are fixed, so the message alone keys the
+    cache. Failed calls raise and are not cached.
 
     Args:
         first_user_message: The first message from the user
 
     Returns:
         str: Generated title (max 50 characters)
+
+    Raises:
+        Exception: If the Bedrock API call fails
     """
-    try:
-        bedrock_client = get_bedrock_client()
-
-        # Simple system prompt for title generation
-        title_system_prompt = (
-            "You are a helpful assistant that generates concise conversation titles. "
-            "Based on the user's message, generate a short, descriptive title (max 50 characters). "
-            "Return ONLY the title text, no quotes, no explanation."
-            "Always response in Traditional Chinese."
-        )
+    bedrock_client = get_bedrock_client()
+
+    # Simple system prompt for title generation
+    title_system_prompt = (
+        "You are a helpful assistant that generates concise conversation titles. "
+        "Based on the user's message, generate a short, descriptive title (max 50 characters). "
+        "Return ONLY the title text, no quotes, no explanation."
+        "Always response in Traditional Chinese."
+    )
 
-        # Use LLM to generate title with title-specific model
-        title = bedrock_client.invoke_llm(
-            user_message=f"Generate a title for this conversation: {first_user_message}",
-            conversation_history=[],
-            system_prompt=title_system_prompt,
-            use_case="title",
-        )
+    # Use LLM to generate title with title-specific model
+    title = bedrock_client.invoke_llm(
+        user_message=f"Generate a title for this conversation: {first_user_message}",
+        conversation_history=[],
+        system_prompt=title_system_prompt,
+        use_case="title",
+    )
 
-        # Clean up and truncate title
-        title = title.strip().strip('"').strip("'")
-        if len(title) > 50:
-            title = title[:47] + "..."
+    # Clean up and truncate title
+    title = title.strip().strip('"').strip("'")
+    if len(title) > 50:
+        title = title[:47] + "..."
+    return title
 
+
+def generate_conversation_title(first_user_message: str) -> str:
+    """
+    Generate a conversation title based on the first user message using LLM.
+
+    Args:
+        first_user_message: The first message from the user
+
+    Returns:
+        str: Generated title (max 50 characters)
+    """
+    try:
+        title = _generate_title_with_llm(first_user_message)
         logger.info(f"Generated conversation title: {title}")
         return title
 
@@ -91,59 +117,235 @@ def get_or_create_conversation(
         if conv:
             return conv
 
-    # Create new conversation
+    # Create new conversation; all column values are generated client-side, so
+    # detach it after the INSERT instead of re-reading the row after commit
+    conv = new_conversation(db=db, user_id=user_id, profile_id=profile_id)
+    db.flush()
+    db.expunge(conv)
+    db.commit()
+    return conv
+
+
+def load_chat_context(
+    db: Session,
+    user_id: uuid.UUID,
+    profile_id: uuid.UUID | None = None,
+    conversation_id: str | None = None,
+    limit: int | None = None,
+) -> tuple[PromptProfile | None, Conversation | None, list[Message]]:
+    """
+    Load profile, conversation and conversation history in a single query.
+
+    The profile (the given one, or the user's default) is outer-joined with the
+    user's conversation and its messages, so one round-trip returns one row per
+    message, or a single row without conversation/messages.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        profile_id: Optional profile ID (uses the user's default profile if not provided)
+        conversation_id: Optional conversation ID to retrieve
+        limit: Maximum number of messages to retrieve (defaults to config setting)
+
+    Returns:
+        tuple: (Profile or None if not found, Conversation or None, list of messages)
+    """
+    if limit is None:
+        limit = settings.CONVERSATION_HISTORY_LIMIT
+
+    if profile_id:
+        profile_filter = PromptProfile.id == profile_id
+    else:
+        profile_filter = PromptProfile.is_default == True  # noqa: E712
+
+    if conversation_id:
+        conversation_join = and_(
+            Conversation.id == conversation_id,
+            Conversation.user_id == user_id,
+        )
+    else:
+        conversation_join = false()
+
+    rows = (
+        db.query(PromptProfile, Conversation, Message)
+        .select_from(PromptProfile)
+        .outerjoin(Conversation, conversation_join)
+        .outerjoin(Message, Message.conversation_id == Conversation.id)
+        .filter(PromptProfile.user_id == user_id, profile_filter)
+        .order_by(Message.created_at)
+        .limit(limit)
+        .all()
+    )
+
+    if not rows:
+        return None, None, []
+
+    profile, conversation, _ = rows[0]
+    history = [message for _, _, message in rows if message is not None]
+    return profile, conversation, history
+
+
+def new_conversation(
+    db: Session,
+    user_id: uuid.UUID,
+    profile_id: uuid.UUID,
+    title: str | None = None,
+) -> Conversation:
+    """
+    Add a new conversation to the session without committing.
+
+    The ID is assigned up front so it can be referenced before the next commit.
+
+    Args:
+        db: Database session
+        user_id: User ID
+        profile_id: Profile ID to associate with conversation
+        title: Optional conversation title
+
+    Returns:
+        Conversation: Pending conversation object
+    """
     conv = Conversation(
+        id=uuid.uuid4(),
         user_id=user_id,
         profile_id=profile_id,
-        title=f"Conversation {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        title=title or f"Conversation {datetime.now().strftime('%Y-%m-%d %H:%M')}",
     )
     db.add(conv)
-    db.commit()
-    db.refresh(conv)
     return conv
 
 
-def save_message(
-    db: Session,
+def new_message(
     conversation_id: uuid.UUID,
     role: MessageRole,
     content: str,
     retrieved_chunks: list | None = None,
 ) -> Message:
     """
-    Save a message to the database.
+    Build a message with its ID and timestamp assigned, without persisting it.
 
     Args:
-        db: Database session
         conversation_id: Conversation ID
         role: Message role (user/assistant)
         content: Message content
         retrieved_chunks: Optional list of retrieved chunk IDs
 
     Returns:
-        Message: Created message object
+        Message: Unsaved message object
     """
-    message = Message(
+    return Message(
+        id=uuid.uuid4(),
         conversation_id=conversation_id,
         role=role.value,
         content=content,
         retrieved_chunks=retrieved_chunks or [],
+        created_at=datetime.utcnow(),
     )
-    db.add(message)
+
+
+def save_messages(db: Session, messages: list[Message]) -> None:
+    """
+    Save messages, together with any other pending changes, in one commit.
+
+    Messages built by new_message carry client-side primary keys and timestamps,
+    so the flush emits them as a single multi-row INSERT without RETURNING.
+
+    Args:
+        db: Database session
+        messages: Messages to insert
+    """
+    db.add_all(messages)
     db.commit()
-    db.refresh(message)
-    return message
 
 
-def generate_response(
+def get_error_message(error: Exception) -> str:
+    """
+    Map an LLM failure to a user-friendly error message.
+
+    Args:
+        error: Exception raised while generating the response
+
+    Returns:
+        str: Message shown to the user in place of the response
+    """
+    # Check if this is a throttling error
+    error_str = str(error)
+    if "ThrottlingException" in error_str or "Too many requests" in error_str:
+        return (
+            "I'm currently experiencing high traffic and need to slow down. "
+            "Please wait a few seconds and try again. "
+            "If this persists, please wait 1-2 minutes before retrying."
+        )
+
+    # Return a generic user-friendly error message
+    return (
+        "Sorry, I encountered an issue processing your request. "
+        "Please try again later or contact technical support."
+    )
+
+
+def _stream_tokens(
+    bedrock_client: BedrockClient,
+    user_message: str,
+    conversation_history: list[Message],
+    system_prompt: str,
+) -> Iterator[str]:
+    """
+    Yield response text chunks from the LLM.
+
+    LLM failures propagate to the consumer, which decides how to report them.
+
+    Args:
+        bedrock_client: Bedrock client configured with the profile's LLM settings
+        user_message: User's message
+        conversation_history: Limited conversation history
+        system_prompt: System prompt to use
+
+    Yields:
+        str: Response text chunks
+
+    Raises:
+        Exception: If the Bedrock API call fails
+    """
+    yield from bedrock_client.stream_llm(
+        user_message=user_message,
+        conversation_history=conversation_history,
+        system_prompt=system_prompt,
+    )
+    logger.info("Response streamed successfully")
+
+
+def _failed_stream(error: Exception) -> Iterator[str]:
+    """
+    Stand in for a response stream whose setup failed.
+
+    Raises the setup error when consumed, so the consumer handles it exactly
+    like an LLM failure during streaming.
+
+    Args:
+        error: Exception raised while preparing the stream
+
+    Raises:
+        Exception: Always, the given error
+    """
+    raise error
+    yield  # unreachable; makes this function a generator
+
+
+def stream_response(
     user_message: str,
     conversation_history: list[Message],
     profile: PromptProfile,
     db: Session | None = None,
     user_id: uuid.UUID | None = None,
-) -> tuple[str, list[dict] | None]:
+) -> tuple[Iterator[str], list[dict] | None]:
     """
-    Generate response to user message using LLM via Bedrock with profile settings.
+    Stream response to user message using LLM via Bedrock with profile settings.
+
+    RAG retrieval runs before this returns; the LLM is only invoked while the
+    returned iterator is consumed. Failures, including ones while preparing the
+    stream, are raised from the iterator; get_error_message maps them to a
+    user-friendly message.
 
     Args:
         user_message: User's message
@@ -153,10 +355,7 @@ def generate_response(
         user_id: User ID (required for RAG retrieval)
 
     Returns:
-        tuple: (Generated response, Retrieved chunks info or None)
-
-    Raises:
-        Exception: If the LLM call fails
+        tuple: (Iterator of response text chunks, Retrieved chunks info or None)
     """
     try:
         # Limit conversation history to recent messages based on config
@@ -240,35 +439,53 @@ def generate_response(
             max_tokens=profile.llm_max_tokens,
         )
 
-        response = bedrock_client.invoke_llm(
+        tokens = _stream_tokens(
+            bedrock_client=bedrock_client,
             user_message=user_message,
             conversation_history=limited_history,
             system_prompt=system_prompt,
-            use_case="conversation",
         )
-
-        logger.info("Response generated successfully")
-        return response, retrieved_chunks
+        return tokens, retrieved_chunks
 
     except Exception as e:
-        logger.error(f"Failed to generate response: {e}")
+        return _failed_stream(e), None
 
-        # Check if this is a throttling error
-        error_str = str(e)
-        if "ThrottlingException" in error_str or "Too many requests" in error_str:
-            error_msg = (
-                "I'm currently experiencing high traffic and need to slow down. "
-                "Please wait a few seconds and try again. "
-                "If this persists, please wait 1-2 minutes before retrying."
-            )
-        else:
-            # Return a generic user-friendly error message
-            error_msg = (
-                "Sorry, I encountered an issue processing your request. "
-                "Please try again later or contact technical support."
-            )
 
-        return error_msg, None
+def generate_response(
+    user_message: str,
+    conversation_history: list[Message],
+    profile: PromptProfile,
+    db: Session | None = None,
+    user_id: uuid.UUID | None = None,
+) -> tuple[str, list[dict] | None]:
+    """
+    Generate response to user message using LLM via Bedrock with profile settings.
+
+    Drains stream_response() into a single string. On failure the response is a
+    user-friendly error message instead.
+
+    Args:
+        user_message: User's message
+        conversation_history: Previous messages in the conversation
+        profile: Prompt profile containing prompts and settings
+        db: Database session (required for RAG retrieval)
+        user_id: User ID (required for RAG retrieval)
+
+    Returns:
+        tuple: (Generated response, Retrieved chunks info or None)
+    """
+    tokens, retrieved_chunks = stream_response(
+        user_message=user_message,
+        conversation_history=conversation_history,
+        profile=profile,
+        db=db,
+        user_id=user_id,
+    )
+    try:
+        return "".join(tokens), retrieved_chunks
+    except Exception as e:
+        logger.error(f"Failed to generate response: {e}")
+        return get_error_message(e), retrieved_chunks
 
 
 def get_conversation_history(
@@ -279,6 +496,11 @@ def get_conversation_history(
     """
     Get conversation history.
 
+    retrieved_chunks is stored as JSONB on the message row (not a relationship),
+    so there is no per-message lazy load. Only the columns the history view needs
+    are fetched; touching the other columns raises instead of issuing a SELECT
+    per message.
+
     Args:
         db: Database session
         conversation_id: Conversation ID
@@ -292,6 +514,15 @@ def get_conversation_history(
 
     return (
         db.query(Message)
+        .options(
+            load_only(
+                Message.id,
+                Message.role,
+                Message.content,
+                Message.created_at,
+                raiseload=True,
+            )
+        )
         .filter(Message.conversation_id == conversation_id)
         .order_by(Message.created_at)
         .limit(limit)
@@ -304,55 +535,48 @@ def get_user_conversations(
     user_id: uuid.UUID,
     profile_id: uuid.UUID | None = None,
     limit: int | None = None,
-) -> list[tuple[Conversation, int]]:
+    before: tuple[datetime, uuid.UUID] | None = None,
+) -> list[Conversation]:
     """
-    Get all conversations for a user with message counts, optionally filtered by profile.
+    Get all conversations for a user, optionally filtered by profile.
+
+    Message counts are read from the denormalized Conversation.message_count column.
+    Results are ordered by (updated_at, id) DESC to match the idx_conv_user_updated
+    index; id breaks ties between conversations updated in the same commit.
 
     Args:
         db: Database session
         user_id: User ID
         profile_id: Optional profile ID to filter conversations
         limit: Maximum number of conversations to retrieve (defaults to config setting)
+        before: Keyset cursor (updated_at, id) of the last conversation on the
+            previous page; only conversations ordered after it are returned
 
     Returns:
-        list[tuple[Conversation, int]]: List of (conversation, message_count) tuples
+        list[Conversation]: List of conversations
     """
     if limit is None:
         limit = settings.USER_CONVERSATIONS_LIMIT
 
-    # Use a subquery to count messages for each conversation efficiently
-    message_count_subquery = (
-        db.query(
-            Message.conversation_id,
-            func.count(Message.id).label("message_count"),
-        )
-        .group_by(Message.conversation_id)
-        .subquery()
-    )
-
-    # Join conversations with message counts
-    query = (
-        db.query(Conversation, func.coalesce(message_count_subquery.c.message_count, 0))
-        .outerjoin(
-            message_count_subquery,
-            Conversation.id == message_count_subquery.c.conversation_id,
-        )
-        .filter(Conversation.user_id == user_id)
-    )
+    query = db.query(Conversation).filter(Conversation.user_id == user_id)
 
     # Add profile filtering when profile_id provided
     if profile_id:
         query = query.filter(Conversation.profile_id == profile_id)
 
-    results = query.order_by(Conversation.updated_at.desc()).limit(limit).all()
+    if before is not None:
+        query = query.filter(tuple_(Conversation.updated_at, Conversation.id) < before)
 
-    return results
+    return query.order_by(Conversation.updated_at.desc(), Conversation.id.desc()).limit(limit).all()
 
 
 def delete_conversation(db: Session, conversation_id: uuid.UUID, user_id: uuid.UUID) -> bool:
     """
     Delete a conversation.
 
+    Ownership check and delete run as one statement; messages are removed by
+    the ON DELETE CASCADE foreign key instead of being loaded and deleted by the ORM.
+
     Args:
         db: Database session
         conversation_id: Conversation ID
@@ -361,18 +585,13 @@ def delete_conversation(db: Session, conversation_id: uuid.UUID, user_id: uuid.U
     Returns:
         bool: True if deleted successfully
     """
-    conv = (
-        db.query(Conversation)
-        .filter(
+    deleted_id = db.execute(
+        delete(Conversation)
+        .where(
             Conversation.id == conversation_id,
             Conversation.user_id == user_id,
         )
-        .first()
-    )
-
-    if not conv:
-        return False
-
-    db.delete(conv)
+        .returning(Conversation.id)
+    ).scalar_one_or_none()
     db.commit()
-    return True
+    return deleted_id is not None
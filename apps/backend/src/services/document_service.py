@@ -5,20 +5,42 @@ Handles document upload, text extraction, chunking, embedding generation,
 and BM25 index creation for hybrid search.
 """
 
+import hashlib
 import logging
 import os
 import re
-from typing import Any
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO
 from uuid import UUID
 
-from sqlalchemy import delete, func, select, text, update
+import numpy as np
+from boto3.s3.transfer import TransferConfig
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.core.config import settings
-from src.models.document import Document, DocumentChunk
+from src.models.document import Document, DocumentChunk, EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
+# Bedrock input type used for document chunks (queries use "search_query")
+EMBEDDING_INPUT_TYPE = "search_document"
+
+# S3 documents up to this size are parsed straight from memory
+S3_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Parallel ranged GETs for objects over 8 MiB, in 16 MiB parts (smaller parts
+# are dominated by per-request overhead), read in 1 MiB I/O chunks
+S3_DOWNLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
 
 class DocumentProcessor:
     """
@@ -107,7 +129,8 @@ class DocumentProcessor:
         Extract text content from document.
 
         Supports both local file paths and S3 URIs (s3://bucket/key).
-        For S3 paths, downloads to temp file, extracts text, and cleans up.
+        S3 objects are spooled into memory (spilling to disk only past
+        S3_SPOOL_MAX_SIZE) and parsed from there, without a temp-file round-trip.
 
         Args:
             file_path: Path to the file (local or s3://bucket/key)
@@ -120,59 +143,34 @@ class DocumentProcessor:
             FileNotFoundError: If file doesn't exist
             ValueError: If file type is unsupported
         """
+        file_type = file_type.lower()
+
         # Check if this is an S3 path
         if file_path.startswith("s3://"):
-            import tempfile
-
-            import boto3
-
-            from src.core.config import settings
-
-            # Parse S3 path
-            s3_path_parts = file_path[5:].split("/", 1)
-            if len(s3_path_parts) != 2:
-                raise ValueError(f"Invalid S3 path format: {file_path}")
-
-            bucket_name = s3_path_parts[0]
-            s3_key = s3_path_parts[1]
+            from src.services.s3_service import get_s3_service, parse_s3_uri
 
-            # Download to temp file
-            s3_client = boto3.client("s3", region_name=settings.AWS_REGION)
-            # Use NamedTemporaryFile for secure temp file creation
-            with tempfile.NamedTemporaryFile(suffix=f".{file_type}", delete=False) as temp_file:
-                temp_file_path = temp_file.name
+            bucket_name, s3_key = parse_s3_uri(file_path)
 
-            try:
-                logger.info(f"Downloading {file_path} to {temp_file_path} for text extraction")
-                s3_client.download_file(bucket_name, s3_key, temp_file_path)
-
-                # Extract text from temp file
-                file_type_lower = file_type.lower()
-                text = self._extract_text_from_local_file(temp_file_path, file_type_lower)
-
-                return text
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file_path):
-                    try:
-                        os.unlink(temp_file_path)
-                        logger.debug(f"Cleaned up temp file: {temp_file_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete temp file {temp_file_path}: {e}")
+            with tempfile.SpooledTemporaryFile(max_size=S3_SPOOL_MAX_SIZE) as buffer:
+                logger.info(f"Downloading {file_path} for text extraction")
+                get_s3_service().s3_client.download_fileobj(
+                    bucket_name, s3_key, buffer, Config=S3_DOWNLOAD_CONFIG
+                )
+                buffer.seek(0)
+                return self._extract_text_from_file(buffer, file_type)
 
         # Local file path
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        file_type = file_type.lower()
-        return self._extract_text_from_local_file(file_path, file_type)
+        return self._extract_text_from_file(file_path, file_type)
 
-    def _extract_text_from_local_file(self, file_path: str, file_type: str) -> str:
+    def _extract_text_from_file(self, source: str | BinaryIO, file_type: str) -> str:
         """
-        Internal method to extract text from a local file.
+        Internal method to extract text from a local file or binary stream.
 
         Args:
-            file_path: Local file path
+            source: Local file path, or a seekable binary file object
             file_type: File type (pdf, docx, txt)
 
         Returns:
@@ -182,8 +180,11 @@ class DocumentProcessor:
         try:
             if file_type == "txt":
                 # Read text file with UTF-8 encoding
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    text = f.read()
+                if isinstance(source, str):
+                    with open(source, encoding="utf-8", errors="ignore") as f:
+                        text = f.read()
+                else:
+                    text = source.read().decode("utf-8", errors="ignore")
                 logger.info(f"Extracted {len(text)} characters from TXT file")
                 return text
 
@@ -192,7 +193,7 @@ class DocumentProcessor:
                 # Filter out pages with garbled encoding (e.g., English pages with broken fonts)
                 from pypdf import PdfReader
 
-                reader = PdfReader(file_path)
+                reader = PdfReader(source)
                 text_parts = []
                 pages_processed = 0
                 pages_skipped = 0
@@ -238,7 +239,7 @@ class DocumentProcessor:
                 # Extract text from DOCX using python-docx
                 from docx import Document
 
-                doc = Document(file_path)
+                doc = Document(source)
                 text_parts = []
 
                 # Extract text from paragraphs
@@ -522,26 +523,85 @@ class DocumentProcessor:
 
         return overlap_text
 
-    def generate_embeddings(self, chunks: list[str]) -> list[list[float]]:
+    def generate_embeddings(self, chunks: list[str]) -> list[np.ndarray]:
         """
         Generate embeddings for text chunks using Cohere Embed v4 via Bedrock.
 
+        Vectors for byte-identical content already in the embedding cache are
+        reused; only the remaining unique chunks are sent to Bedrock, and their
+        vectors are added to the cache.
+
         Args:
             chunks: List of text chunks
 
         Returns:
             List of embedding vectors (1024 dimensions each)
 
+        Raises:
+            Exception: If embedding generation fails
+        """
+        hashes = [hashlib.sha256(chunk.encode("utf-8")).digest() for chunk in chunks]
+        embeddings_by_hash = self._get_cached_embeddings(set(hashes))
+
+        # Unique chunks not in the cache, in first-seen order
+        missing: dict[bytes, str] = {}
+        for content_hash, chunk in zip(hashes, chunks, strict=True):
+            if content_hash not in embeddings_by_hash:
+                missing.setdefault(content_hash, chunk)
+
+        logger.info(
+            f"Embedding cache: {len(chunks) - len(missing)}/{len(chunks)} chunks reused, "
+            f"{len(missing)} to embed"
+        )
+
+        if missing:
+            new_embeddings = dict(
+                zip(missing.keys(), self._embed_texts(list(missing.values())), strict=True)
+            )
+            self._cache_embeddings(new_embeddings)
+            embeddings_by_hash.update(new_embeddings)
+
+        return [embeddings_by_hash[content_hash] for content_hash in hashes]
+
+    def _embed_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Embed texts via Bedrock in concurrent provider-sized batches.
+
+        Texts are split into batches which are sent concurrently, with at most
+        EMBEDDING_MAX_CONCURRENCY requests in flight. Results keep the order of
+        the input texts.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            float32 array with one embedding row per text
+
         Raises:
             Exception: If embedding generation fails
         """
         from src.core.bedrock_client import get_bedrock_client
 
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
         try:
             bedrock_client = get_bedrock_client()
-            embeddings = bedrock_client.generate_embeddings(
-                texts=chunks, input_type="search_document"
-            )
+
+            def embed_batch(batch: list[str]) -> np.ndarray:
+                return bedrock_client.generate_embeddings(
+                    texts=batch, input_type=EMBEDDING_INPUT_TYPE, batch_size=batch_size
+                )
+
+            max_workers = min(settings.EMBEDDING_MAX_CONCURRENCY, len(batches))
+            if max_workers <= 1:
+                batch_results = [embed_batch(batch) for batch in batches]
+            else:
+                # boto3 clients are thread-safe; map() yields results in input order
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    batch_results = list(executor.map(embed_batch, batches))
+
+            embeddings = np.concatenate(batch_results)
 
             logger.info(f"Generated {len(embeddings)} embeddings using Bedrock")
             return embeddings
@@ -550,6 +610,62 @@ class DocumentProcessor:
             logger.error(f"Failed to generate embeddings via Bedrock: {e}")
             raise
 
+    def _get_cached_embeddings(self, hashes: set[bytes]) -> dict[bytes, np.ndarray]:
+        """
+        Look up cached embeddings for content hashes in one query.
+
+        Runs in a SAVEPOINT so a failed lookup never rolls back the processor's
+        pending writes. Cache errors are logged and treated as misses.
+
+        Args:
+            hashes: sha256 digests of chunk contents
+
+        Returns:
+            dict mapping content hash to its cached embedding
+        """
+        if not hashes:
+            return {}
+
+        try:
+            stmt = select(EmbeddingCache.content_hash, EmbeddingCache.embedding).where(
+                EmbeddingCache.content_hash.in_(hashes),
+                EmbeddingCache.model_id == settings.EMBEDDING_MODEL_ID,
+                EmbeddingCache.input_type == EMBEDDING_INPUT_TYPE,
+            )
+            with self.db.begin_nested():
+                return {row.content_hash: row.embedding for row in self.db.execute(stmt)}
+
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed, embedding all chunks: {e}")
+            return {}
+
+    def _cache_embeddings(self, embeddings_by_hash: dict[bytes, np.ndarray]) -> None:
+        """
+        Store new embeddings in the cache, ignoring entries that already exist.
+
+        Written in a SAVEPOINT on the processor's transaction, so it is committed
+        with the document's own status update and a cache error never ends that
+        transaction. Cache errors are logged and otherwise ignored.
+
+        Args:
+            embeddings_by_hash: dict mapping content hash to its embedding
+        """
+        try:
+            rows = [
+                {
+                    "content_hash": content_hash,
+                    "model_id": settings.EMBEDDING_MODEL_ID,
+                    "input_type": EMBEDDING_INPUT_TYPE,
+                    "embedding": embedding,
+                }
+                for content_hash, embedding in embeddings_by_hash.items()
+            ]
+            with self.db.begin_nested():
+                self.db.execute(pg_insert(EmbeddingCache).on_conflict_do_nothing(), rows)
+
+        except Exception as e:
+            logger.warning(f"Failed to store embeddings in cache: {e}")
+
     def create_bm25_indexes(self, chunks: list[str]) -> list[str]:
         """
         Create BM25 full-text search indexes for chunks.
@@ -581,7 +697,7 @@ class DocumentProcessor:
         self,
         document_id: UUID,
         chunks: list[str],
-        embeddings: list[list[float]],
+        embeddings: list[np.ndarray],
         bm25_vectors: list[str],
     ) -> None:
         """
@@ -607,8 +723,8 @@ class DocumentProcessor:
                     chunk_index=idx,
                     content=chunk_text,
                     embedding=embedding,
-                    # content_tsvector will be set via UPDATE after insert
-                    # Using 'simple' text search config for better Chinese support
+                    # content_tsvector is set by the trg_chunk_tsvector trigger on insert,
+                    # using the 'simple' text search config for better Chinese support
                     chunk_metadata={
                         "char_count": len(chunk_text),
                         "word_count": len(chunk_text.split()),
@@ -616,21 +732,8 @@ class DocumentProcessor:
                 )
                 chunk_objects.append(chunk_obj)
 
-            # Bulk insert chunks first
+            # Bulk insert chunks; each row is written once, tsvector included
             self.db.add_all(chunk_objects)
-            self.db.flush()  # Flush to get IDs assigned
-
-            # Update content_tsvector for all chunks using raw SQL
-            # Use 'simple' text search config for better Chinese support
-            # 'simple' doesn't do stemming, which works better for Chinese text
-            for chunk_obj in chunk_objects:
-                self.db.execute(
-                    text(
-                        "UPDATE document_chunks SET content_tsvector = to_tsvector('simple', :content) WHERE id = :id"
-                    ),
-                    {"content": chunk_obj.content, "id": chunk_obj.id},
-                )
-
             self.db.commit()
 
             logger.info(f"Saved {len(chunk_objects)} chunks for document {document_id}")
@@ -672,9 +775,7 @@ class DocumentProcessor:
             # Don't raise here to avoid masking original errors
 
 
-def get_user_documents(
-    db: Session, user_id: UUID, profile_id: UUID | None = None
-) -> list[dict[str, Any]]:
+def get_user_documents(db: Session, user_id: UUID, profile_id: UUID | None = None) -> list[Row]:
     """
     Get all documents uploaded by a user, optionally filtered by profile.
 
@@ -684,7 +785,7 @@ def get_user_documents(
         profile_id: Optional profile UUID to filter documents
 
     Returns:
-        List of document metadata dictionaries
+        List of document metadata rows (document columns plus chunk_count)
     """
     stmt = (
         select(
@@ -718,26 +819,7 @@ def get_user_documents(
 
     stmt = stmt.order_by(Document.upload_date.desc())
 
-    result = db.execute(stmt)
-    rows = result.all()
-
-    documents = []
-    for row in rows:
-        documents.append(
-            {
-                "id": str(row.id),
-                "file_name": row.file_name,
-                "file_type": row.file_type,
-                "file_size": row.file_size,
-                "storage_type": row.storage_type,
-                "upload_date": row.upload_date.isoformat(),
-                "status": row.status,
-                "error_message": row.error_message,
-                "chunk_count": row.chunk_count,
-            }
-        )
-
-    return documents
+    return db.execute(stmt).all()
 
 
 def delete_document(db: Session, document_id: UUID, user_id: UUID) -> bool:
@@ -753,25 +835,31 @@ def delete_document(db: Session, document_id: UUID, user_id: UUID) -> bool:
         True if deleted successfully, False if not found
     """
     try:
-        # Check if document exists and belongs to user
-        stmt = select(Document).where(
-            Document.id == document_id,
-            Document.user_id == user_id,
+        # Ownership check and delete in one statement (cascades to chunks);
+        # RETURNING gives the storage location for the file cleanup below
+        stmt = (
+            delete(Document)
+            .where(
+                Document.id == document_id,
+                Document.user_id == user_id,
+            )
+            .returning(Document.file_path, Document.storage_type)
         )
-        result = db.execute(stmt)
-        document = result.scalar_one_or_none()
+        document = db.execute(stmt).one_or_none()
 
         if not document:
+            db.rollback()
             return False
 
-        # Delete file based on storage type
+        db.commit()
+
+        # Delete file based on storage type, once the row is gone
         if document.storage_type == "cloud":
             # Delete from S3
             try:
-                from src.services.s3_service import S3Service
+                from src.services.s3_service import get_s3_service
 
-                s3_service = S3Service()
-                success = s3_service.delete_file(document.file_path)
+                success = get_s3_service().delete_file(document.file_path)
                 if not success:
                     logger.warning(f"Failed to delete S3 file: {document.file_path}")
             except Exception as e:
@@ -785,11 +873,6 @@ def delete_document(db: Session, document_id: UUID, user_id: UUID) -> bool:
                 except Exception as e:
                     logger.warning(f"Failed to delete local file {document.file_path}: {e}")
 
-        # Delete document (cascades to chunks)
-        stmt = delete(Document).where(Document.id == document_id)
-        db.execute(stmt)
-        db.commit()
-
         logger.info(f"Deleted document {document_id}")
         return True
 
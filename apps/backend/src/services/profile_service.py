@@ -5,10 +5,11 @@ Profile service for managing prompt profiles.
 import uuid
 
 from fastapi import HTTPException, status
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session, load_only
 
 from src.models.prompt_profile import PromptProfile
+from src.models.user import User
 from src.prompts.system_prompts import (
     HR_ADVISOR_RAG_SYSTEM_PROMPT_TEMPLATE,
     HR_ADVISOR_SYSTEM_PROMPT,
@@ -19,6 +20,9 @@ def get_user_profiles(db: Session, user_id: uuid.UUID) -> list[PromptProfile]:
     """
     Get all profiles for a user, sorted by is_default DESC, created_at ASC.
 
+    Only the summary columns shown in the profile list are loaded; the prompt
+    texts and LLM settings are left in the database (accessing them raises).
+
     Args:
         db: Database session
         user_id: User ID
@@ -28,6 +32,17 @@ def get_user_profiles(db: Session, user_id: uuid.UUID) -> list[PromptProfile]:
     """
     return (
         db.query(PromptProfile)
+        .options(
+            load_only(
+                PromptProfile.id,
+                PromptProfile.name,
+                PromptProfile.description,
+                PromptProfile.is_default,
+                PromptProfile.created_at,
+                PromptProfile.updated_at,
+                raiseload=True,
+            )
+        )
         .filter(PromptProfile.user_id == user_id)
         .order_by(PromptProfile.is_default.desc(), PromptProfile.created_at.asc())
         .all()
@@ -94,6 +109,28 @@ def get_default_profile(db: Session, user_id: uuid.UUID) -> PromptProfile:
     return profile
 
 
+def get_default_profile_id(user: User) -> uuid.UUID:
+    """
+    Get default profile ID resolved for the current user.
+
+    Args:
+        user: Current user (from get_current_user)
+
+    Returns:
+        uuid.UUID: Default profile ID
+
+    Raises:
+        HTTPException: If no default profile found (HTTP 404)
+    """
+    if not user.default_profile_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No default profile found for user",
+        )
+
+    return user.default_profile_id
+
+
 def create_profile(
     db: Session,
     user_id: uuid.UUID,
@@ -373,6 +410,9 @@ def set_default_profile(db: Session, profile_id: uuid.UUID, user_id: uuid.UUID)
     """
     Set profile as default, unset previous default.
 
+    Both flags flip in one UPDATE that only touches the current default and the
+    target row, so there is no round-trip in which two profiles are default.
+
     Args:
         db: Database session
         profile_id: Profile ID
@@ -381,20 +421,24 @@ def set_default_profile(db: Session, profile_id: uuid.UUID, user_id: uuid.UUID)
     Raises:
         HTTPException: If profile not found (HTTP 404)
     """
-    profile = get_profile_by_id(db, profile_id, user_id)
+    result = db.execute(
+        update(PromptProfile)
+        .where(
+            PromptProfile.user_id == user_id,
+            or_(PromptProfile.is_default, PromptProfile.id == profile_id),
+        )
+        .values(is_default=PromptProfile.id == profile_id)
+        .returning(PromptProfile.id)
+    )
 
-    if not profile:
+    if profile_id not in result.scalars().all():
+        # Target is missing or not owned; undo unsetting the current default
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found",
         )
 
-    # Unset all user's profiles as default
-    db.query(PromptProfile).filter(PromptProfile.user_id == user_id).update({"is_default": False})
-
-    # Set target profile as default
-    profile.is_default = True
-
     db.commit()
 
 
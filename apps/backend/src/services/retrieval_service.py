@@ -11,6 +11,7 @@ import logging
 from typing import Any
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
@@ -36,7 +37,7 @@ class RetrievalService:
 
     def semantic_search(
         self,
-        query_embedding: list[float],
+        query_embedding: np.ndarray,
         top_k: int,
         user_id: UUID | None = None,
         profile_id: UUID | None = None,
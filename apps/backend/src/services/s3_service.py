@@ -9,6 +9,7 @@ the backend Lambda function.
 import logging
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from src.core.config import settings
@@ -16,12 +17,39 @@ from src.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def parse_s3_uri(s3_uri: str) -> tuple[str, str]:
+    """
+    Split an s3://bucket/key URI into its bucket and key.
+
+    Args:
+        s3_uri: S3 URI in format s3://bucket/key
+
+    Returns:
+        tuple[str, str]: Bucket name and object key
+
+    Raises:
+        ValueError: If s3_uri is not an s3:// URI with both a bucket and a key
+    """
+    if not s3_uri.startswith("s3://"):
+        raise ValueError(f"Invalid S3 path format: {s3_uri}")
+    bucket, _, key = s3_uri.removeprefix("s3://").partition("/")
+    if not bucket or not key:
+        raise ValueError(f"Invalid S3 path format: {s3_uri}")
+    return bucket, key
+
+
 class S3Service:
     """Service for S3 operations including pre-signed URLs."""
 
     def __init__(self):
         """Initialize S3 client with configured region and bucket."""
-        self.s3_client = boto3.client("s3", region_name=settings.AWS_REGION)
+        # The client is shared process-wide, and each threaded download can use up
+        # to 10 connections, so size the pool above botocore's default of 10
+        client_config = Config(
+            max_pool_connections=50,
+            retries={"max_attempts": 3, "mode": "adaptive"},
+        )
+        self.s3_client = boto3.client("s3", region_name=settings.AWS_REGION, config=client_config)
         self.bucket_name = settings.DOCUMENT_BUCKET
 
     def generate_presigned_upload_url(
@@ -101,17 +129,7 @@ class S3Service:
             ValueError: If s3_uri format is invalid
         """
         try:
-            if not s3_uri.startswith("s3://"):
-                raise ValueError(f"Invalid S3 URI: {s3_uri}")
-
-            # Parse s3://bucket/key
-            parts = s3_uri[5:].split("/", 1)
-            bucket = parts[0]
-            key = parts[1] if len(parts) > 1 else ""
-
-            if not key:
-                raise ValueError(f"No key found in S3 URI: {s3_uri}")
-
+            bucket, key = parse_s3_uri(s3_uri)
             self.s3_client.delete_object(Bucket=bucket, Key=key)
             logger.info(f"Deleted S3 file: {s3_uri}")
             return True
@@ -142,11 +160,21 @@ class S3Service:
         return content_types.get(file_type.lower(), "application/octet-stream")
 
 
+# Global singleton instance
+_s3_service: S3Service | None = None
+
+
 def get_s3_service() -> S3Service:
     """
-    Get S3 service instance.
+    Get or create the global S3Service instance.
+
+    boto3 clients are thread-safe and expensive to build (service model
+    loading), so one client is shared by requests and background tasks.
 
     Returns:
         S3Service: Configured S3 service instance
     """
-    return S3Service()
+    global _s3_service
+    if _s3_service is None:
+        _s3_service = S3Service()
+    return _s3_service
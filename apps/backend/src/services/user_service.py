@@ -4,10 +4,13 @@ User service for user management and authentication.
 
 import uuid
 
+from sqlalchemy import and_, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from src.core.security import get_password_hash, verify_password
 from src.models import User
+from src.models.prompt_profile import PromptProfile
 from src.services import profile_service
 
 
@@ -36,7 +39,7 @@ def get_user_by_email(db: Session, email: str) -> User | None:
     Returns:
         User | None: User if found, None otherwise
     """
-    return db.query(User).filter(User.email == email).first()
+    return db.query(User).filter(func.lower(User.email) == email.lower()).first()
 
 
 def get_user_by_id(db: Session, user_id: uuid.UUID) -> User | None:
@@ -53,16 +56,49 @@ def get_user_by_id(db: Session, user_id: uuid.UUID) -> User | None:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_user_with_default_profile_id(
+    db: Session, user_id: uuid.UUID
+) -> tuple[User | None, uuid.UUID | None]:
+    """
+    Get user by ID together with their default profile ID in one query.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        tuple: (User if found else None, default profile ID if any else None)
+    """
+    row = (
+        db.query(User, PromptProfile.id)
+        .outerjoin(
+            PromptProfile,
+            and_(
+                PromptProfile.user_id == User.id,
+                PromptProfile.is_default == True,  # noqa: E712
+            ),
+        )
+        .filter(User.id == user_id)
+        .first()
+    )
+    if not row:
+        return None, None
+    return row[0], row[1]
+
+
 def create_user(
     db: Session,
     username: str,
     email: str,
     password: str,
     full_name: str | None = None,
-) -> User:
+) -> User | None:
     """
     Create a new user.
 
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING so the uniqueness checks on
+    username and email happen atomically in the same round trip as the insert.
+
     Args:
         db: Database session
         username: Username
@@ -71,25 +107,61 @@ def create_user(
         full_name: Optional full name
 
     Returns:
-        User: Created user object
+        User | None: Created user object, or None if username or email is taken
     """
     hashed_password = get_password_hash(password)
-    user = User(
-        username=username,
-        email=email,
-        hashed_password=hashed_password,
-        full_name=full_name,
+    stmt = (
+        pg_insert(User)
+        .values(
+            username=username,
+            email=email,
+            hashed_password=hashed_password,
+            full_name=full_name,
+        )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    user = db.scalars(stmt).first()
+    if user is None:
+        return None
+
+    # Detach so the RETURNING values stay loaded after the profile commit below
+    db.expunge(user)
 
-    # Create default profile for new user
+    # Create default profile for new user (commits the user insert as well)
     profile_service.create_default_profile(db=db, user_id=user.id)
 
     return user
 
 
+def get_registration_conflict(db: Session, username: str, email: str) -> str | None:
+    """
+    Describe why a registration conflicted with an existing user.
+
+    Only called after create_user reports a conflict, so the happy path stays
+    a single INSERT.
+
+    Args:
+        db: Database session
+        username: Requested username
+        email: Requested email address
+
+    Returns:
+        str | None: Error detail for the conflicting field, None if no conflict remains
+    """
+    existing_username = (
+        db.query(User.username)
+        .filter(or_(User.username == username, func.lower(User.email) == email.lower()))
+        .limit(1)
+        .scalar()
+    )
+    if existing_username is None:
+        return None
+    if existing_username == username:
+        return "Username already registered"
+    return "Email already registered"
+
+
 def authenticate_user(db: Session, username: str, password: str) -> User | None:
     """
     Authenticate user with username and password.
@@ -0,0 +1,140 @@
+"""
+End-to-end tests for the chat message routes over a stubbed Converse stream.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pytest
+
+from src.models import Conversation, MessageRole
+from src.services import chat_service
+
+NOVA_MODEL_ID = "amazon.nova-lite-v1:0"
+
+
+def converse_stream_response(*texts: str) -> dict:
+    """Build a bedrock-runtime converse_stream response streaming the given text deltas."""
+    events = [{"messageStart": {"role": "assistant"}}]
+    events += [{"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": t}}} for t in texts]
+    events += [
+        {"contentBlockStop": {"contentBlockIndex": 0}},
+        {"messageStop": {"stopReason": "end_turn"}},
+        {
+            "metadata": {
+                "usage": {
+                    "inputTokens": 10,
+                    "outputTokens": len(texts),
+                    "totalTokens": 10 + len(texts),
+                },
+                "metrics": {"latencyMs": 1},
+            }
+        },
+    ]
+    return {"stream": events}
+
+
+@pytest.fixture
+def runtime():
+    """Stubbed bedrock-runtime client."""
+    runtime = MagicMock()
+    # ChatBedrock builds its control-plane client from these
+    runtime.meta.region_name = "us-east-1"
+    runtime._client_config = None
+    runtime.converse_stream.return_value = converse_stream_response("Hello", "", " world")
+    with patch("src.core.bedrock_client.get_bedrock_runtime", return_value=runtime):
+        yield runtime
+
+
+@pytest.fixture
+def chat_context(user):
+    """Profile, existing conversation and history returned by load_chat_context."""
+    profile = SimpleNamespace(
+        id=user.default_profile_id,
+        name="Default",
+        system_prompt="You are a helpful assistant.",
+        rag_system_prompt_template="Context:\n{context}",
+        llm_model_id=NOVA_MODEL_ID,
+        llm_temperature=0.7,
+        llm_top_p=0.9,
+        llm_max_tokens=512,
+        top_k_chunks=5,
+        semantic_search_ratio=0.5,
+        relevance_threshold=0.0,
+    )
+    conversation = Conversation(
+        id=uuid.uuid4(), user_id=user.id, profile_id=profile.id, title="Chat"
+    )
+    history = [
+        chat_service.new_message(conversation.id, MessageRole.USER, "Hi"),
+        chat_service.new_message(conversation.id, MessageRole.ASSISTANT, "Hi there"),
+    ]
+    retrieval_service = MagicMock()
+    retrieval_service.hybrid_search.return_value = []
+    with (
+        patch.object(
+            chat_service, "load_chat_context", return_value=(profile, conversation, history)
+        ),
+        patch(
+            "src.services.retrieval_service.get_retrieval_service", return_value=retrieval_service
+        ),
+    ):
+        yield conversation
+
+
+def parse_sse(body: str) -> list[tuple[str, object]]:
+    """Split a server-sent event stream into (event, decoded data) pairs."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event_line, data_line = block.split("\n")
+        events.append(
+            (event_line.removeprefix("event: "), orjson.loads(data_line.removeprefix("data: ")))
+        )
+    return events
+
+
+@pytest.mark.usefixtures("chat_context")
+def test_send_message_joins_streamed_text(client, db, runtime):
+    response = client.post("/chat/message", json={"message": "Say hello"})
+
+    assert response.status_code == 200
+    messages = response.json()["messages"]
+    assert [m["role"] for m in messages] == ["user", "assistant"]
+    assert messages[1]["content"] == "Hello world"
+    assert runtime.converse_stream.call_args.kwargs["modelId"] == NOVA_MODEL_ID
+    saved = db.add_all.call_args.args[0]
+    assert [m.content for m in saved] == ["Say hello", "Hello world"]
+    db.commit.assert_called_once()
+
+
+@pytest.mark.usefixtures("runtime")
+def test_send_message_stream_emits_text_tokens(client, db, chat_context):
+    response = client.post("/chat/message/stream", json={"message": "Say hello"})
+
+    assert response.status_code == 200
+    events = parse_sse(response.text)
+    assert events[:-1] == [("token", "Hello"), ("token", " world")]
+    event, payload = events[-1]
+    assert event == "done"
+    assert payload["conversation_id"] == str(chat_context.id)
+    assert payload["messages"][1]["content"] == "Hello world"
+    saved = db.add_all.call_args.args[0]
+    assert [m.content for m in saved] == ["Say hello", "Hello world"]
+
+
+@pytest.mark.usefixtures("chat_context")
+def test_send_message_stream_reports_llm_error(client, db, runtime):
+    runtime.converse_stream.side_effect = RuntimeError("ThrottlingException")
+
+    response = client.post("/chat/message/stream", json={"message": "Say hello"})
+
+    events = parse_sse(response.text)
+    assert [event for event, _ in events] == ["error"]
+    assert events[0][1]["detail"] == chat_service.get_error_message(
+        RuntimeError("ThrottlingException")
+    )
+    # The user message is kept even though the model produced nothing
+    saved = db.add_all.call_args.args[0]
+    assert [m.content for m in saved] == ["Say hello"]
@@ -0,0 +1,117 @@
+"""
+Tests for DocumentProcessor embedding generation.
+"""
+
+import hashlib
+import random
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.core.config import settings
+from src.services.document_service import DocumentProcessor
+
+
+def fake_embedding(text: str) -> np.ndarray:
+    """Deterministic per-text vector, so results can be matched back to their input."""
+    return np.full(4, sum(map(ord, text)), dtype=np.float32)
+
+
+class FakeBedrockClient:
+    """Embeds batches with a random delay so concurrent batches finish out of order."""
+
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def generate_embeddings(self, texts: list[str], **_: object) -> np.ndarray:
+        self.batches.append(texts)
+        time.sleep(random.uniform(0, 0.02))
+        return np.stack([fake_embedding(text) for text in texts])
+
+
+@pytest.fixture
+def bedrock():
+    """Small concurrent batches against the fake Bedrock client."""
+    client = FakeBedrockClient()
+    with (
+        patch.object(settings, "EMBEDDING_BATCH_SIZE", 2),
+        patch.object(settings, "EMBEDDING_MAX_CONCURRENCY", 4),
+        patch("src.core.bedrock_client.get_bedrock_client", return_value=client),
+    ):
+        yield client
+
+
+def test_embed_texts_keeps_input_order_across_concurrent_batches(bedrock):
+    texts = [f"chunk {i}" for i in range(11)]
+
+    embeddings = DocumentProcessor(MagicMock())._embed_texts(texts)
+
+    assert embeddings.shape == (11, 4)
+    assert embeddings.dtype == np.float32
+    np.testing.assert_array_equal(embeddings, np.stack([fake_embedding(t) for t in texts]))
+    assert sorted(bedrock.batches) == sorted(texts[i : i + 2] for i in range(0, 11, 2))
+
+
+def test_embed_texts_propagates_batch_failure(bedrock):
+    bedrock.generate_embeddings = MagicMock(side_effect=RuntimeError("throttled"))
+
+    with pytest.raises(RuntimeError, match="throttled"):
+        DocumentProcessor(MagicMock())._embed_texts(["a", "b", "c"])
+
+
+def cache_db(cached: dict[str, np.ndarray]) -> MagicMock:
+    """Session whose embedding cache lookup returns the given text -> vector entries."""
+    db = MagicMock()
+    db.execute.return_value = [
+        SimpleNamespace(content_hash=hashlib.sha256(text.encode()).digest(), embedding=vector)
+        for text, vector in cached.items()
+    ]
+    return db
+
+
+def test_generate_embeddings_mixes_cache_hits_and_misses_in_chunk_order(bedrock):
+    cached_vector = np.full(4, -1, dtype=np.float32)
+    db = cache_db({"cached": cached_vector})
+    chunks = ["a", "cached", "b", "a", "c", "d", "cached", "e"]
+
+    embeddings = DocumentProcessor(db).generate_embeddings(chunks)
+
+    expected = [cached_vector if chunk == "cached" else fake_embedding(chunk) for chunk in chunks]
+    np.testing.assert_array_equal(np.stack(embeddings), np.stack(expected))
+    # Only unique misses are embedded, in first-seen order
+    assert sorted(bedrock.batches) == [["a", "b"], ["c", "d"], ["e"]]
+    # ...and only they are written back to the cache
+    insert_rows = db.execute.call_args_list[-1].args[1]
+    assert [row["content_hash"] for row in insert_rows] == [
+        hashlib.sha256(text.encode()).digest() for text in ["a", "b", "c", "d", "e"]
+    ]
+
+
+def test_generate_embeddings_all_hits_skips_bedrock(bedrock):
+    db = cache_db({"a": fake_embedding("a"), "b": fake_embedding("b")})
+
+    embeddings = DocumentProcessor(db).generate_embeddings(["b", "a", "b"])
+
+    np.testing.assert_array_equal(
+        np.stack(embeddings), np.stack([fake_embedding(t) for t in "bab"])
+    )
+    assert bedrock.batches == []
+    db.execute.assert_called_once()
+
+
+def test_generate_embeddings_treats_cache_errors_as_misses(bedrock):
+    db = MagicMock()
+    db.execute.side_effect = [RuntimeError("lookup failed"), RuntimeError("insert failed")]
+
+    embeddings = DocumentProcessor(db).generate_embeddings(["a", "b", "a"])
+
+    np.testing.assert_array_equal(
+        np.stack(embeddings), np.stack([fake_embedding(t) for t in "aba"])
+    )
+    assert sorted(bedrock.batches) == [["a", "b"]]
+    # Both cache statements ran in savepoints, leaving the outer transaction alone
+    assert db.begin_nested.call_count == 2
+    db.rollback.assert_not_called()
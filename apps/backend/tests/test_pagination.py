@@ -0,0 +1,193 @@
+"""
+Tests for keyset pagination of chunk and conversation listings.
+"""
+
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from src.api.routes import embed
+from src.core.config import settings
+from src.services import chat_service
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+# ========== Chunks ==========
+
+
+@pytest.fixture
+def document():
+    """Document owned by the current user."""
+    document = SimpleNamespace(id=uuid.uuid4(), file_name="report.pdf")
+    with patch.object(embed, "get_document_with_ownership", return_value=document):
+        yield document
+
+
+def chunk_rows(document, indexes: range, total: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            document_id=document.id,
+            chunk_index=i,
+            content=f"chunk {i}",
+            created_at=datetime(2026, 1, 1),
+            chunk_metadata={},
+            embedding_dim=1536,
+            total=total,
+        )
+        for i in indexes
+    ]
+
+
+def test_list_chunks_fetches_one_extra_row_for_has_more(client, db, document):
+    db.execute.return_value.all.return_value = chunk_rows(document, range(3), total=5)
+
+    response = client.get(f"/embeds/documents/{document.id}/chunks", params={"limit": 2})
+
+    body = response.json()
+    assert [c["chunk_index"] for c in body["chunks"]] == [0, 1]
+    assert body["has_more"] is True
+    assert body["next_cursor"] == 1
+    assert body["total"] == 5
+    assert "LIMIT 3" in compile_sql(db.execute.call_args.args[0])
+
+
+def test_list_chunks_exactly_full_last_page_has_no_cursor(client, db, document):
+    db.execute.return_value.all.return_value = chunk_rows(document, range(3, 5), total=5)
+
+    response = client.get(
+        f"/embeds/documents/{document.id}/chunks", params={"limit": 2, "after_index": 2}
+    )
+
+    body = response.json()
+    assert [c["chunk_index"] for c in body["chunks"]] == [3, 4]
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+    assert body["total"] == 5
+
+
+def test_list_chunks_cursor_does_not_narrow_total(client, db, document):
+    db.execute.return_value.all.return_value = chunk_rows(document, range(3, 5), total=5)
+
+    client.get(f"/embeds/documents/{document.id}/chunks", params={"limit": 2, "after_index": 2})
+
+    sql = compile_sql(db.execute.call_args.args[0])
+    outer_where = sql.rsplit("WHERE", 1)[1]
+    assert "document_chunks.chunk_index > 2" in outer_where
+    total_subquery = sql.split("AS total")[0]
+    assert "chunk_index >" not in total_subquery
+
+
+def test_list_chunks_empty_page_past_the_end_still_reports_total(client, db, document):
+    db.execute.return_value.all.return_value = []
+    db.scalar.return_value = 5
+
+    response = client.get(
+        f"/embeds/documents/{document.id}/chunks", params={"limit": 2, "after_index": 4}
+    )
+
+    body = response.json()
+    assert body["chunks"] == []
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+    assert body["total"] == 5
+
+
+# ========== Conversations ==========
+
+
+def conversations(*updated_ids: tuple[datetime, uuid.UUID]) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            id=conv_id,
+            title="Chat",
+            created_at=updated_at,
+            updated_at=updated_at,
+            message_count=2,
+        )
+        for updated_at, conv_id in updated_ids
+    ]
+
+
+@pytest.fixture
+def page_size():
+    with patch.object(settings, "USER_CONVERSATIONS_LIMIT", 2):
+        yield 2
+
+
+def test_get_user_conversations_filters_and_orders_on_updated_at_and_id():
+    captured: list[Query] = []
+    cursor = (datetime(2026, 1, 1, 12, 0, 0, 123456), uuid.uuid4())
+
+    with patch.object(Query, "all", lambda self: captured.append(self) or []):
+        chat_service.get_user_conversations(
+            Session(), user_id=uuid.uuid4(), profile_id=uuid.uuid4(), limit=3, before=cursor
+        )
+
+    sql = compile_sql(captured[0].statement)
+    assert (
+        "(conversations.updated_at, conversations.id) < "
+        f"('2026-01-01 12:00:00.123456', '{cursor[1]}')" in sql
+    )
+    assert sql.endswith("ORDER BY conversations.updated_at DESC, conversations.id DESC \n LIMIT 3")
+
+
+@pytest.mark.usefixtures("page_size")
+def test_get_conversations_cursor_round_trips_ties_on_updated_at(client):
+    # Three conversations updated in the same commit, so only id orders them
+    updated_at = datetime(2026, 1, 1, 12, 0, 0, 123456)
+    ids = sorted((uuid.uuid4() for _ in range(3)), reverse=True)
+    rows = conversations(*((updated_at, conv_id) for conv_id in ids))
+
+    with patch.object(chat_service, "get_user_conversations", return_value=rows) as service:
+        first = client.get("/chat/conversations").json()
+    assert service.call_args.kwargs["limit"] == 3
+    assert service.call_args.kwargs["before"] is None
+    assert [c["id"] for c in first["conversations"]] == [str(i) for i in ids[:2]]
+    assert first["has_more"] is True
+    assert first["next_cursor_id"] == str(ids[1])
+
+    with patch.object(chat_service, "get_user_conversations", return_value=rows[2:]) as service:
+        second = client.get(
+            "/chat/conversations",
+            params={"before": first["next_cursor"], "before_id": first["next_cursor_id"]},
+        ).json()
+    assert service.call_args.kwargs["before"] == (updated_at, ids[1])
+    assert [c["id"] for c in second["conversations"]] == [str(ids[2])]
+    assert second["has_more"] is False
+    assert second["next_cursor"] is None
+    assert second["next_cursor_id"] is None
+
+
+@pytest.mark.usefixtures("page_size")
+def test_get_conversations_exactly_full_last_page_has_no_cursor(client):
+    rows = conversations(
+        (datetime(2026, 1, 2), uuid.uuid4()),
+        (datetime(2026, 1, 1), uuid.uuid4()),
+    )
+
+    with patch.object(chat_service, "get_user_conversations", return_value=rows):
+        body = client.get("/chat/conversations").json()
+
+    assert len(body["conversations"]) == 2
+    assert body["has_more"] is False
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.parametrize(
+    "params", [{"before": "2026-01-01T00:00:00"}, {"before_id": str(uuid.uuid4())}]
+)
+def test_get_conversations_rejects_half_a_cursor(client, params):
+    with patch.object(chat_service, "get_user_conversations") as service:
+        response = client.get("/chat/conversations", params=params)
+
+    assert response.status_code == 400
+    service.assert_not_called()
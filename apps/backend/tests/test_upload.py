@@ -0,0 +1,105 @@
+"""
+Tests for the pre-signed upload route.
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.api.routes import upload
+
+
+def presigned(document_id: str, filename: str, file_type: str, expiration: int) -> dict:
+    """Stand-in for S3Service.generate_presigned_upload_url."""
+    key = f"uploads/{document_id}_{filename}"
+    return {
+        "url": f"https://bucket.s3.amazonaws.com/{key}?expires={expiration}",
+        "s3_key": key,
+        "s3_path": f"s3://bucket/{key}",
+        "content_type": f"application/{file_type}",
+    }
+
+
+@pytest.fixture
+def s3_service():
+    """Stubbed S3 service that signs URLs locally."""
+    service = MagicMock()
+    service.generate_presigned_upload_url.side_effect = presigned
+    with patch.object(upload, "get_s3_service", return_value=service):
+        yield service
+
+
+def upload_request(**overrides) -> dict:
+    return {
+        "filename": "report.pdf",
+        "file_type": "pdf",
+        "file_size": 1024,
+        "idempotency_key": str(uuid.uuid4()),
+        **overrides,
+    }
+
+
+def stored_row(db: MagicMock) -> SimpleNamespace:
+    """Make the upsert return the row built from its own VALUES, as a fresh insert does."""
+
+    def execute(stmt):
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        row = SimpleNamespace(
+            id=params["id"], file_name=params["file_name"], file_type=params["file_type"]
+        )
+        result = MagicMock()
+        result.one.return_value = row
+        return result
+
+    db.execute.side_effect = execute
+
+
+@pytest.mark.usefixtures("s3_service")
+def test_presigned_url_creates_pending_document(client, db):
+    stored_row(db)
+
+    response = client.post("/upload/presigned-url", json=upload_request())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["s3_key"] == f"uploads/{body['document_id']}_report.pdf"
+    db.commit.assert_called_once()
+
+
+def test_presigned_url_upsert_targets_pending_upload_key(client, db, s3_service):
+    stored_row(db)
+    key = uuid.uuid4()
+
+    client.post("/upload/presigned-url", json=upload_request(idempotency_key=str(key)))
+
+    stmt = db.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (user_id, upload_key) WHERE status = %(status_1)s AND storage_type" in sql
+    assert "DO UPDATE SET upload_date = excluded.upload_date" in sql
+    assert stmt.compile(dialect=postgresql.dialect()).params["upload_key"] == key
+    s3_service.generate_presigned_upload_url.assert_called_once()
+
+
+def test_presigned_url_retry_signs_stored_pending_document(client, db, s3_service):
+    existing = SimpleNamespace(id=uuid.uuid4(), file_name="original.pdf", file_type="pdf")
+    db.execute.return_value.one.return_value = existing
+
+    # A retry with the same key but different metadata still gets the stored row's key
+    response = client.post(
+        "/upload/presigned-url", json=upload_request(filename="renamed.docx", file_type="docx")
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["document_id"] == str(existing.id)
+    assert body["s3_key"] == f"uploads/{existing.id}_original.pdf"
+    assert body["content_type"] == "application/pdf"
+    assert s3_service.generate_presigned_upload_url.call_args.kwargs == {
+        "document_id": str(existing.id),
+        "filename": "original.pdf",
+        "file_type": "pdf",
+        "expiration": 300,
+    }
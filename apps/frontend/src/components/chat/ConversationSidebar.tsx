@@ -3,7 +3,7 @@ import { ScrollArea } from '@/components/ui/scroll-area';
 import { Separator } from '@/components/ui/separator';
 import { Skeleton } from '@/components/ui/skeleton';
 import type { Conversation } from '@/types/chat';
-import { MessageSquarePlus, MessageSquare, Trash2, RefreshCw } from 'lucide-react';
+import { MessageSquarePlus, MessageSquare, Trash2, RefreshCw, Loader2 } from 'lucide-react';
 
 interface ConversationSidebarProps {
   conversations: Conversation[];
@@ -14,6 +14,9 @@ interface ConversationSidebarProps {
   onRefresh: () => void;
   isRefreshing?: boolean;
   isLoading?: boolean;
+  hasMore?: boolean;
+  onLoadMore?: () => void;
+  isLoadingMore?: boolean;
 }
 
 export const ConversationSidebar = ({
@@ -25,6 +28,9 @@ export const ConversationSidebar = ({
   onRefresh,
   isRefreshing = false,
   isLoading = false,
+  hasMore = false,
+  onLoadMore,
+  isLoadingMore = false,
 }: ConversationSidebarProps) => {
   return (
     <div className="w-64 border-r bg-muted/10 flex flex-col h-full">
@@ -98,6 +104,19 @@ export const ConversationSidebar = ({
               </div>
             ))
           )}
+
+          {hasMore && onLoadMore && (
+            <Button
+              onClick={onLoadMore}
+              className="w-full"
+              variant="ghost"
+              size="sm"
+              disabled={isLoadingMore}
+            >
+              {isLoadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+              Load more
+            </Button>
+          )}
         </div>
       </ScrollArea>
     </div>
@@ -1,7 +1,8 @@
 import { Accordion, AccordionContent, AccordionItem, AccordionTrigger } from "@/components/ui/accordion";
 import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
 import { Loader2 } from "lucide-react";
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import { getDocumentChunks } from "@/services/embedService";
 
 interface ChunkAccordionProps {
@@ -10,11 +11,17 @@ interface ChunkAccordionProps {
 }
 
 export function ChunkAccordion({ documentId }: ChunkAccordionProps) {
-  const { data, isLoading, error } = useQuery({
+  const { data, isLoading, error, fetchNextPage, hasNextPage, isFetchingNextPage } = useInfiniteQuery({
     queryKey: ['chunks', documentId],
-    queryFn: () => getDocumentChunks(documentId),
+    queryFn: ({ pageParam }) => getDocumentChunks(documentId, pageParam),
+    initialPageParam: null as number | null,
+    getNextPageParam: (lastPage) => (lastPage.has_more ? lastPage.next_cursor : undefined),
   });
 
+  const chunks = data?.pages.flatMap((page) => page.chunks) ?? [];
+  // The first page is fetched without a cursor, so its total covers the whole document
+  const total = data?.pages[0]?.total ?? 0;
+
   if (isLoading) {
     return (
       <div className="flex items-center justify-center p-8">
@@ -31,10 +38,10 @@ export function ChunkAccordion({ documentId }: ChunkAccordionProps) {
     );
   }
 
-  const totalChars = data?.chunks.reduce((sum, chunk) => {
+  const totalChars = chunks.reduce((sum, chunk) => {
     const charCount = typeof chunk.metadata?.char_count === 'number' ? chunk.metadata.char_count : 0;
     return sum + charCount;
-  }, 0) || 0;
+  }, 0);
 
   return (
     <div className="border rounded-lg p-4 space-y-4 bg-muted/30">
@@ -42,7 +49,7 @@ export function ChunkAccordion({ documentId }: ChunkAccordionProps) {
       <div className="flex items-center gap-6">
         <div>
           <p className="text-sm font-medium text-muted-foreground">Total Chunks</p>
-          <p className="text-2xl font-bold">{data?.total || 0}</p>
+          <p className="text-2xl font-bold">{total}</p>
         </div>
         <div>
           <p className="text-sm font-medium text-muted-foreground">Total Characters</p>
@@ -51,9 +58,9 @@ export function ChunkAccordion({ documentId }: ChunkAccordionProps) {
       </div>
 
       {/* Individual Chunks */}
-      {data && data.chunks.length > 0 ? (
+      {chunks.length > 0 ? (
         <Accordion type="single" collapsible className="w-full">
-          {data.chunks.map((chunk) => (
+          {chunks.map((chunk) => (
             <AccordionItem key={chunk.id} value={`chunk-${chunk.id}`}>
               <AccordionTrigger>
                 <div className="flex items-center gap-2">
@@ -81,6 +88,20 @@ export function ChunkAccordion({ documentId }: ChunkAccordionProps) {
           No chunks available for this document.
         </div>
       )}
+
+      {hasNextPage && (
+        <div className="flex justify-center">
+          <Button
+            variant="outline"
+            size="sm"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+          >
+            {isFetchingNextPage && <Loader2 className="h-4 w-4 animate-spin" />}
+            Load more chunks
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
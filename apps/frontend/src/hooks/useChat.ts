@@ -1,13 +1,18 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useInfiniteQuery, useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { chatService } from '@/services/chatService';
 import { useChatStore } from '@/stores/chatStore';
-import type { ChatRequest } from '@/types/chat';
+import type { ChatRequest, ConversationCursor } from '@/types/chat';
 import { toast } from 'sonner';
 
 export const useConversations = (profileId?: string) => {
-  return useQuery({
+  return useInfiniteQuery({
     queryKey: ['conversations', profileId],
-    queryFn: () => chatService.getConversations(profileId),
+    queryFn: ({ pageParam }) => chatService.getConversations(profileId, pageParam),
+    initialPageParam: null as ConversationCursor | null,
+    getNextPageParam: (lastPage): ConversationCursor | undefined =>
+      lastPage.has_more && lastPage.next_cursor && lastPage.next_cursor_id
+        ? { before: lastPage.next_cursor, before_id: lastPage.next_cursor_id }
+        : undefined,
   });
 };
 
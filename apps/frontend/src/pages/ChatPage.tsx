@@ -17,7 +17,15 @@ export const ChatPage = () => {
   } = useChatStore();
   const { currentProfile } = useProfileStore();
 
-  const { data: conversationsData, isLoading: conversationsLoading, refetch: refetchConversations } = useConversations(currentProfile?.id);
+  const {
+    data: conversationsData,
+    isLoading: conversationsLoading,
+    refetch: refetchConversations,
+    fetchNextPage: fetchMoreConversations,
+    hasNextPage: hasMoreConversations,
+    isFetchingNextPage: isFetchingMoreConversations,
+  } = useConversations(currentProfile?.id);
+  const conversations = conversationsData?.pages.flatMap((page) => page.conversations) ?? [];
   const { mutate: sendMessage } = useSendMessage();
   const { refetch: refetchHistory } = useConversationHistory(activeConversationId);
 
@@ -73,13 +81,16 @@ export const ChatPage = () => {
   return (
     <div className="flex h-full w-full">
       <ConversationSidebar
-        conversations={conversationsData?.conversations || []}
+        conversations={conversations}
         activeConversationId={activeConversationId}
         onSelectConversation={handleSelectConversation}
         onNewConversation={handleNewConversation}
         onDeleteConversation={handleDeleteConversation}
         onRefresh={handleRefreshConversations}
         isRefreshing={conversationsLoading}
+        hasMore={hasMoreConversations}
+        onLoadMore={() => fetchMoreConversations()}
+        isLoadingMore={isFetchingMoreConversations}
       />
 
       <div className="flex-1 flex flex-col min-h-0">
@@ -3,6 +3,7 @@ import { API_ENDPOINTS } from '@/lib/apiEndpoints';
 import type {
   ChatRequest,
   ChatResponse,
+  ConversationCursor,
   ConversationListResponse,
   ConversationHistoryResponse
 } from '@/types/chat';
@@ -16,10 +17,14 @@ export const chatService = {
     return response.data;
   },
 
-  getConversations: async (profileId?: string): Promise<ConversationListResponse> => {
+  // Pass the previous page's cursor to fetch the next (older) page
+  getConversations: async (
+    profileId?: string,
+    cursor?: ConversationCursor | null
+  ): Promise<ConversationListResponse> => {
     const response = await api.get<ConversationListResponse>(
       API_ENDPOINTS.CHAT_CONVERSATIONS,
-      { params: profileId ? { profile_id: profileId } : undefined }
+      { params: { profile_id: profileId, ...cursor } }
     );
     return response.data;
   },
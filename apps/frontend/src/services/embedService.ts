@@ -3,11 +3,17 @@ import { API_ENDPOINTS } from '@/lib/apiEndpoints';
 import type { ChunkListResponse } from '@/types/embed';
 
 /**
- * Get all chunks for a document (read-only)
+ * Get a page of chunks for a document (read-only)
+ *
+ * Pass the previous page's next_cursor as afterIndex to fetch the next page.
  */
-export const getDocumentChunks = async (documentId: string): Promise<ChunkListResponse> => {
+export const getDocumentChunks = async (
+  documentId: string,
+  afterIndex?: number | null
+): Promise<ChunkListResponse> => {
   const response = await api.get<ChunkListResponse>(
-    API_ENDPOINTS.EMBED_DOCUMENT_CHUNKS(documentId)
+    API_ENDPOINTS.EMBED_DOCUMENT_CHUNKS(documentId),
+    { params: afterIndex != null ? { after_index: afterIndex } : undefined }
   );
   return response.data;
 };
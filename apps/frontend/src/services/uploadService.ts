@@ -1,5 +1,6 @@
 import axios from 'axios';
 import { api } from '@/lib/api';
+import { randomUUID } from '@/lib/utils';
 import type {
   PresignedUrlRequest,
   PresignedUrlResponse,
@@ -24,6 +25,9 @@ import type {
  *    - Poll document status via React Query
  */
 
+// Attempts for the pre-signed URL request; retries reuse the upload's idempotency key
+const PRESIGNED_URL_ATTEMPTS = 3;
+
 /**
  * Get upload configuration from backend
  */
@@ -46,6 +50,28 @@ export async function requestPresignedUrl(
   return response.data;
 }
 
+/**
+ * Request a pre-signed URL, retrying network errors and 5xx responses.
+ * Every attempt sends the same idempotency key, so a request that reached the
+ * backend but lost its response reuses that pending document.
+ */
+export async function requestPresignedUrlWithRetry(
+  data: PresignedUrlRequest,
+  profileId?: string
+): Promise<PresignedUrlResponse> {
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await requestPresignedUrl(data, profileId);
+    } catch (error) {
+      const retryable =
+        axios.isAxiosError(error) && (!error.response || error.response.status >= 500);
+      if (!retryable || attempt >= PRESIGNED_URL_ATTEMPTS) {
+        throw error;
+      }
+    }
+  }
+}
+
 /**
  * Step 2: Upload file directly to S3 using pre-signed URL
  * Note: This bypasses the API client to upload directly to S3
@@ -157,11 +183,12 @@ export async function uploadDocumentViaS3(
   // Extract file extension from filename
   const fileExtension = file.name.split('.').pop()?.toLowerCase() || '';
 
-  // Step 1: Request pre-signed URL
-  const { upload_url, document_id } = await requestPresignedUrl({
+  // Step 1: Request pre-signed URL (one key per upload, shared by its retries)
+  const { upload_url, document_id } = await requestPresignedUrlWithRetry({
     filename: file.name,
     file_type: fileExtension,
     file_size: file.size,
+    idempotency_key: randomUUID(),
   }, profileId);
 
   // Step 2: Upload to S3
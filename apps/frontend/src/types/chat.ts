@@ -27,6 +27,15 @@ export type ChatResponse = {
 
 export type ConversationListResponse = {
   conversations: Conversation[];
+  has_more: boolean;
+  next_cursor: string | null;
+  next_cursor_id: string | null;
+}
+
+// Keyset cursor taken from a previous page's next_cursor / next_cursor_id
+export type ConversationCursor = {
+  before: string;
+  before_id: string;
 }
 
 export type ConversationHistoryResponse = {
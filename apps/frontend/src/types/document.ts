@@ -14,6 +14,7 @@ export interface PresignedUrlRequest {
   filename: string;
   file_type: string;
   file_size: number;
+  idempotency_key?: string;
 }
 
 export interface PresignedUrlResponse {
@@ -13,4 +13,6 @@ export interface ChunkListResponse {
   total: number;
   document_id: string;
   document_name: string;
+  has_more: boolean;
+  next_cursor: number | null;
 }